@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Optional
 from pathlib import Path
 
@@ -43,11 +44,14 @@ class GroupController:
         self.local_office_web_session_store = local_office_web_session_store
 
         self.group_panes_by_page = {}
+        self.page_by_pane = {}
+        self.pending_states_by_page = {}
 
     def _connect_pane_signals(self, pane_controller):
-        pane_controller.currentPathChanged.connect(self.on_pane_path_changed)
-        pane_controller.navigationStateChanged.connect(self.on_pane_navigation_changed)
-        pane_controller.groupRequested.connect(self.on_pane_group_requested)
+        # Bind the pane up front so the handlers need neither sender() nor a type check.
+        pane_controller.currentPathChanged.connect(partial(self.on_pane_path_changed, pane_controller))
+        pane_controller.navigationStateChanged.connect(partial(self.on_pane_navigation_changed, pane_controller))
+        pane_controller.groupRequested.connect(partial(self.on_pane_group_requested, pane_controller))
 
     def apply_close_icon_settings(self, show_file_tab_close_icons: bool):
         for pane_controller in self.group_panes_by_page.values():
@@ -80,23 +84,9 @@ class GroupController:
     def initialize_existing_groups(self):
         for index in range(self.group_tabs.count()):
             page = self.group_tabs.widget(index)
-            pane_controller = GroupWorkspaceWidget(
-                self.model,
-                parent=self.host_ui,
-                editor_settings=self.editor_settings,
-                remote_drive_controller=self.remote_drive_controller,
-                local_office_web_session_store=self.local_office_web_session_store,
-            )
-            pane_controller.widget.setParent(None)
-            pane_controller.widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-            self.group_panes_by_page[page] = pane_controller
-            self._connect_pane_signals(pane_controller)
-
-    def create_group(self, title=None, start_path=None):
-        debug_log(f"GroupController.create_group(title={title}, start_path={start_path})")
-        start_path = QDir.cleanPath(start_path or QDir.homePath())
-        page = QWidget(self.group_tabs)
+            self._register_pane(page, self._new_pane_controller())
 
+    def _new_pane_controller(self):
         pane_controller = GroupWorkspaceWidget(
             self.model,
             parent=self.host_ui,
@@ -106,11 +96,23 @@ class GroupController:
         )
         pane_controller.widget.setParent(None)
         pane_controller.widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        return pane_controller
 
-        tab_title = title if title is not None else f"{app_tr('GroupController', 'Gruppe')} {len(self.visible_group_indices()) + 1}"
-        index = self.group_tabs.addTab(page, tab_title)
+    def _register_pane(self, page, pane_controller):
         self.group_panes_by_page[page] = pane_controller
+        self.page_by_pane[pane_controller] = page
         self._connect_pane_signals(pane_controller)
+
+    def create_group(self, title=None, start_path=None):
+        debug_log(f"GroupController.create_group(title={title}, start_path={start_path})")
+        start_path = QDir.cleanPath(start_path or QDir.homePath())
+        page = QWidget(self.group_tabs)
+
+        pane_controller = self._new_pane_controller()
+
+        tab_title = title if title is not None else f"{app_tr('GroupController', 'Gruppe')} {len(self.visible_group_indices()) + 1}"
+        index = self.group_tabs.addTab(page, tab_title)
+        self._register_pane(page, pane_controller)
         pane_controller.navigate_to(start_path, push_history=False)
 
         self.group_tabs.setCurrentIndex(index)
@@ -119,6 +121,23 @@ class GroupController:
         debug_log(f"GroupController.create_group finished index={index}")
         return pane_controller
 
+    def create_pending_group(self, title, icon_value, pending_state):
+        page = QWidget(self.group_tabs)
+        page.setProperty("group_icon", icon_value)
+        tab_title = title if title is not None else f"{app_tr('GroupController', 'Gruppe')} {len(self.visible_group_indices()) + 1}"
+        self.group_tabs.addTab(page, tab_title)
+        self.pending_states_by_page[page] = pending_state
+        return page
+
+    def materialize_pending_group(self, page):
+        pending_state = self.pending_states_by_page.pop(page, None)
+        if pending_state is None:
+            return None, None
+        debug_log("GroupController.materialize_pending_group")
+        pane_controller = self._new_pane_controller()
+        self._register_pane(page, pane_controller)
+        return pane_controller, pending_state
+
     def close_group(self, index, confirm=True):
         if self.group_tabs.count() <= 1:
             return
@@ -143,6 +162,8 @@ class GroupController:
         transfer_active_index = 0
         should_transfer_to_group_zero = len(self.visible_group_indices()) == 1
         pane_controller = self.group_panes_by_page.pop(page, None)
+        self.page_by_pane.pop(pane_controller, None)
+        self.pending_states_by_page.pop(page, None)
         if should_transfer_to_group_zero and pane_controller and hasattr(pane_controller, "clone_tab_states"):
             cloned = pane_controller.clone_tab_states()
             if isinstance(cloned, tuple) and len(cloned) == 2:
@@ -179,6 +200,8 @@ class GroupController:
         for index in range(self.group_tabs.count() - 1, 0, -1):
             page = self.group_tabs.widget(index)
             pane_controller = self.group_panes_by_page.pop(page, None)
+            self.page_by_pane.pop(pane_controller, None)
+            self.pending_states_by_page.pop(page, None)
             if pane_controller:
                 if hasattr(pane_controller, "prepare_for_dispose"):
                     pane_controller.prepare_for_dispose()
@@ -258,6 +281,12 @@ class GroupController:
     def visible_group_indices(self):
         return list(range(1, self.group_tabs.count()))
 
+    def iter_visible_groups(self):
+        # Yields in tab order (tabs are movable, so dict order is not reliable).
+        for index in range(1, self.group_tabs.count()):
+            page = self.group_tabs.widget(index)
+            yield index, page, self.group_panes_by_page.get(page), self.pending_states_by_page.get(page)
+
     def get_group_zero_pane(self):
         if self.group_tabs.count() == 0:
             return None
@@ -31,6 +31,7 @@ from services.file_actions import (
     BatchRenameService,
     CreationService,
     DeleteService,
+    DeleteWorker,
     DropService,
     DropUiService,
     FileOperationService,
@@ -177,6 +178,16 @@ class PaneController(QObject):
         self._stop_file_operation_thread(wait_forever=True)
         self._cleanup_file_operation_state()
 
+        if self._delete_thread is not None:
+            try:
+                self._delete_thread.quit()
+                self._delete_thread.wait()
+            except RuntimeError:
+                pass
+            self._delete_thread = None
+            self._delete_worker = None
+            self._pending_delete = None
+
         if self._search_thread is not None:
             try:
                 self._search_thread.quit()
@@ -347,6 +358,9 @@ class PaneController(QObject):
         self._file_operation_worker = None
         self._file_operation_progress_dialog = None
         self._pending_file_operation = None
+        self._delete_thread = None
+        self._delete_worker = None
+        self._pending_delete = None
         self._search_thread = None
         self._search_worker = None
         self._ark_drop_watchers = set()
@@ -2666,8 +2680,14 @@ class PaneController(QObject):
                 error_messages[0],
             )
 
+    def _file_operation_in_progress(self):
+        # Copies, moves and deletes of one pane never overlap: each would
+        # refresh and reselect while the other is still changing the folder.
+        # The copy thread may outlive its worker, so the worker is what counts.
+        return self._delete_thread is not None or self._file_operation_worker is not None
+
     def _start_file_operation(self, source_paths, target_directory, operation, clear_clipboard_on_success=False):
-        if self._file_operation_thread is not None:
+        if self._file_operation_thread is not None or self._file_operation_in_progress():
             self.show_operation_feedback(app_tr("PaneController", "Dateioperation bereits aktiv"))
             return False
 
@@ -2781,6 +2801,10 @@ class PaneController(QObject):
             self._delete_selected_remote_paths()
             return
 
+        if self._file_operation_in_progress():
+            self.show_operation_feedback(app_tr("PaneController", "Dateioperation bereits aktiv"))
+            return
+
         selected = self.selected_paths()
         if not selected:
             return
@@ -2803,12 +2827,38 @@ class PaneController(QObject):
         )
         if not confirmed:
             return
+        if self._file_operation_in_progress():
+            self.show_operation_feedback(app_tr("PaneController", "Dateioperation bereits aktiv"))
+            return
 
-        delete_result = self._delete_service.execute(
-            existing_selected,
-            permanent=permanent,
-            file_operations=self.file_operations,
-        )
+        # Trashing or removing large trees can take a while; keep the event
+        # loop responsive and finish up in _on_delete_finished.
+        self._pending_delete = {"paths": existing_selected, "permanent": permanent}
+        self._delete_thread = QThread(self)
+        self._delete_worker = DeleteWorker(self._delete_service, existing_selected, permanent, self.file_operations)
+        self._delete_worker.moveToThread(self._delete_thread)
+        self._delete_thread.started.connect(self._delete_worker.run)
+        self._delete_worker.finished.connect(self._on_delete_finished)
+        self._delete_worker.finished.connect(self._delete_thread.quit)
+        self._delete_thread.finished.connect(self._delete_worker.deleteLater)
+        self._delete_thread.finished.connect(self._on_delete_thread_finished)
+        self._delete_thread.start()
+
+    def _on_delete_thread_finished(self):
+        thread = self._delete_thread
+        self._delete_thread = None
+        self._delete_worker = None
+        if thread is not None:
+            thread.deleteLater()
+
+    def _on_delete_finished(self, delete_result):
+        metadata = self._pending_delete or {}
+        self._pending_delete = None
+        if self._dispose_prepared:
+            return
+
+        existing_selected = metadata.get("paths", [])
+        permanent = bool(metadata.get("permanent", False))
         changes_applied = bool(delete_result.deleted_paths)
 
         if changes_applied:
@@ -4510,6 +4560,9 @@ class PaneController(QObject):
 
         self.commit_pending_tree_edit()
         if force_rescan and self.current_location is not None and self.current_location.is_local:
+            # A forced rescan means the disk changed behind our back; drop the
+            # cached stats file operations rely on as well.
+            self.file_operations.invalidate_cache()
             # Force QFileSystemModel cache invalidation by switching root once.
             try:
                 self.model.setRootPath(QDir.rootPath())
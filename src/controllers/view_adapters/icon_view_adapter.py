@@ -16,19 +16,27 @@ class IconViewAdapter:
         if selection_model is None:
             return []
 
-        paths = []
-        for index in selection_model.selectedIndexes():
-            if not index.isValid() or index.column() != 0:
-                continue
-            model = self._model()
-            if not hasattr(model, "filePath"):
-                continue
-            path = model.filePath(index)
-            if path:
-                paths.append(QDir.cleanPath(path))
-
-        if paths:
-            return list(dict.fromkeys(paths))
+        indexes = selection_model.selectedIndexes()
+        model = self._model() if indexes else None
+        # Without filePath() the selection says nothing; fall back to the
+        # current index below, as before the fast path.
+        if indexes and hasattr(model, "filePath"):
+            if len(indexes) == 1:
+                index = indexes[0]
+                path = model.filePath(index) if index.isValid() and index.column() == 0 else ""
+                if path:
+                    return [QDir.cleanPath(path)]
+            else:
+                paths = []
+                for index in indexes:
+                    if not index.isValid() or index.column() != 0:
+                        continue
+                    path = model.filePath(index)
+                    if path:
+                        paths.append(QDir.cleanPath(path))
+
+                if paths:
+                    return list(dict.fromkeys(paths))
 
         current_index = self.icon_view.currentIndex()
         if current_index.isValid():
@@ -66,13 +74,17 @@ class IconViewAdapter:
         if not hasattr(source_model, "filePath"):
             return []
 
+        # The views are bound to the file model directly (no sort/filter proxy),
+        # so resolve the bound methods once instead of per selected index.
+        file_path = source_model.filePath
+        clean_path = QDir.cleanPath
         paths = []
         for index in selection_model.selectedIndexes():
             if not index.isValid() or index.column() != 0:
                 continue
-            path = source_model.filePath(index)
+            path = file_path(index)
             if path:
-                paths.append(QDir.cleanPath(path))
+                paths.append(clean_path(path))
 
         return list(dict.fromkeys(paths))
 
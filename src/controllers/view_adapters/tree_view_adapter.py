@@ -27,19 +27,27 @@ class TreeViewAdapter:
         if selection_model is None:
             return []
 
-        paths = []
-        for index in selection_model.selectedRows(0):
-            if not index.isValid():
-                continue
-            model = self._model()
-            if not hasattr(model, "filePath"):
-                continue
-            path = model.filePath(index)
-            if path:
-                paths.append(QDir.cleanPath(path))
-
-        if paths:
-            return list(dict.fromkeys(paths))
+        rows = selection_model.selectedRows(0)
+        model = self._model() if rows else None
+        # Without filePath() the selection says nothing; fall back to the
+        # current index below, as before the fast path.
+        if rows and hasattr(model, "filePath"):
+            if len(rows) == 1:
+                index = rows[0]
+                path = model.filePath(index) if index.isValid() else ""
+                if path:
+                    return [QDir.cleanPath(path)]
+            else:
+                paths = []
+                for index in rows:
+                    if not index.isValid():
+                        continue
+                    path = model.filePath(index)
+                    if path:
+                        paths.append(QDir.cleanPath(path))
+
+                if paths:
+                    return list(dict.fromkeys(paths))
 
         current_index = self.tree_view.currentIndex()
         if current_index.isValid():
@@ -80,13 +88,17 @@ class TreeViewAdapter:
         if not hasattr(source_model, "filePath"):
             return []
 
+        # The views are bound to the file model directly (no sort/filter proxy),
+        # so resolve the bound methods once instead of per selected row.
+        file_path = source_model.filePath
+        clean_path = QDir.cleanPath
         paths = []
         for index in selection_model.selectedRows(0):
             if not index.isValid():
                 continue
-            path = source_model.filePath(index)
+            path = file_path(index)
             if path:
-                paths.append(QDir.cleanPath(path))
+                paths.append(clean_path(path))
 
         return list(dict.fromkeys(paths))
 
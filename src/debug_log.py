@@ -1,30 +1,84 @@
 from __future__ import annotations
 
-from datetime import datetime
+import atexit
 from pathlib import Path
 import threading
+import time
 import traceback
 
 _log_path: Path | None = None
 _lock = threading.Lock()
+_pending: list[tuple[float, str]] = []
+_pending_ready = threading.Condition(threading.Lock())
+_writer_thread: threading.Thread | None = None
 
 
 def initialize_debug_log(path: Path) -> None:
     global _log_path
     _log_path = path
     _log_path.parent.mkdir(parents=True, exist_ok=True)
+    _start_writer()
     _write_line("--- Debug logging started ---")
 
 
+def flush_debug_log() -> None:
+    # Holding _lock while taking the batch guarantees that a flush returns
+    # only after every line queued before it has reached the file.
+    with _lock:
+        with _pending_ready:
+            if not _pending:
+                return
+            batch = _pending[:]
+            _pending.clear()
+        if _log_path is None:
+            return
+
+        lines = []
+        last_second = -1
+        second_prefix = ""
+        for stamp, message in batch:
+            second = int(stamp)
+            if second != last_second:
+                last_second = second
+                second_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            millis = int((stamp - second) * 1000)
+            lines.append(f"[{second_prefix}.{millis:03d}] {message}\n")
+
+        with _log_path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(lines))
+
+
 def debug_log(message: str) -> None:
     _write_line(message)
 
 
 def debug_exception(prefix: str, exc: BaseException) -> None:
+    if _log_path is None:
+        return
     details = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
     _write_line(f"{prefix}: {details}")
 
 
+def debug_unhandled_exception(exc_type, exc_value, exc_traceback) -> None:
+    # Called from sys.excepthook, possibly right before the process dies:
+    # write synchronously, after anything still queued, and stream the
+    # traceback chunk by chunk instead of joining it into one string first.
+    if _log_path is None:
+        return
+    flush_debug_log()
+
+    stamp = time.time()
+    second = int(stamp)
+    prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+    millis = int((stamp - second) * 1000)
+    with _lock:
+        with _log_path.open("a", encoding="utf-8") as handle:
+            handle.write(f"[{prefix}.{millis:03d}] UNHANDLED EXCEPTION: ")
+            for chunk in traceback.TracebackException(exc_type, exc_value, exc_traceback).format():
+                handle.write(chunk)
+            handle.write("\n")
+
+
 def debug_mime_data(prefix: str, mime_data) -> None:
     if mime_data is None:
         _write_line(f"{prefix}: mime_data=None")
@@ -68,9 +122,29 @@ def _write_line(message: str) -> None:
     if _log_path is None:
         return
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-    line = f"[{timestamp}] {message}\n"
+    # Producers only capture the wall-clock time; formatting and file I/O
+    # happen on the writer thread, which drains queued lines in batches.
+    entry = (time.time(), message)
+    with _pending_ready:
+        _pending.append(entry)
+        _pending_ready.notify()
 
-    with _lock:
-        with _log_path.open("a", encoding="utf-8") as handle:
-            handle.write(line)
+
+def _start_writer() -> None:
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    _writer_thread = threading.Thread(target=_writer_loop, name="debug-log-writer", daemon=True)
+    _writer_thread.start()
+    atexit.register(flush_debug_log)
+
+
+def _writer_loop() -> None:
+    while True:
+        with _pending_ready:
+            while not _pending:
+                _pending_ready.wait()
+        try:
+            flush_debug_log()
+        except OSError:
+            pass
@@ -2,42 +2,53 @@
 # Licensed under the EUPL-1.2-or-later
 # https://github.com/acambule/tablion
 
+import os
 import sys
 import json
-import copy
 import shutil
-import traceback
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 from PySide6.QtGui import QAction, QIcon, QKeySequence
-from PySide6.QtWidgets import (QApplication, QMainWindow, QTreeWidget, QSplitter, QWidget, QToolButton, QStyle, QMenu, QTabWidget, QVBoxLayout, QSizePolicy, QMessageBox, QFileDialog)
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QDir, QEvent, Qt, QTimer, QStandardPaths, QUrl
+from PySide6.QtWidgets import (QApplication, QMainWindow, QTreeWidget, QSplitter, QWidget, QToolButton, QStyle, QMenu, QStackedWidget, QTabWidget, QVBoxLayout, QSizePolicy, QMessageBox, QFileDialog)
+from PySide6.QtCore import QDir, QEvent, Qt, QTimer, QStandardPaths, QUrl, Signal
 
-from controllers.group_controller import GroupController
 from controllers.remote_drive_controller import RemoteDriveController
-from debug_log import debug_exception, debug_log, initialize_debug_log
+from debug_log import debug_exception, debug_log, debug_unhandled_exception, initialize_debug_log
 from localization import app_tr, ask_yes_no, apply_localization, setup_localization
 from models.editor_settings import EditorSettings
 from models.file_system_model import FileSystemModel
 from models.local_office_web_session_store import LocalOfficeWebSessionStore
-from models.navigator import DEFAULT_NAVIGATOR_DATA, NavigatorManager
 from models.remote_connection_settings import RemoteConnectionSettings
 from models.remote_mount_settings import RemoteMountSettings
-from widgets.settings_dialog import SettingsDialog
+from models.session_payload import SessionPayload
 from single_application import SingleApplication
-from widgets.group_workspace_widget import GroupWorkspaceWidget
+from utils.json_io import dumps_json_bytes, loads_json_bytes, write_bytes_atomic
 
 
 APP_NAME = "Tablion"
+_MODULE_DIR = Path(__file__).resolve().parent
+_APP_ICON_CANDIDATES = (
+    os.path.join(_MODULE_DIR.parent, "assets", "tablion-icon.png"),
+    os.path.join(_MODULE_DIR.parent, "assets", "tablion-icon.svg"),
+)
 
 
 class MainWindow(QMainWindow):
+    # Emitted from the session writer thread; delivered queued on the GUI thread.
+    sessionWriteFailed = Signal()
+
+    _icon_cache: dict[tuple, QIcon] = {}
+
     def __init__(self):
         super().__init__(None)
+        self._home_path = QDir.homePath()
+        from PySide6.QtUiTools import QUiLoader
+
         loader = QUiLoader()
-        ui_path = Path(__file__).resolve().parent / 'ui' / 'main.ui'
+        ui_path = _MODULE_DIR / 'ui' / 'main.ui'
         self.navigator_data_path = Path()
         self.session_data_path = Path()
         self.debug_log_path = Path()
@@ -63,6 +74,8 @@ class MainWindow(QMainWindow):
 
         self.group_tabs = None
         self.group_content_host = None
+        self._group_stack = None
+        self._splitter = None
         self.group_controller = None
         self.navigator_manager = None
         self.btn_nav_menu = None
@@ -75,9 +88,28 @@ class MainWindow(QMainWindow):
         self._action_split_single = None
         self._action_split_2 = None
         self._action_split_4 = None
+        self._group_tabs_menu = None
+        self._action_new_group = None
+        self._action_rename_group = None
+        self._action_close_group = None
+        self._group_header_height = 30
+        self._focus_connected = False
         self._settings_dialog = None
         self.plain_tabbing_mode = True
         self._persisted_once = False
+        self._session_dirty = False
+        self._session_restore_pending = False
+        self._last_saved_session_bytes = None
+        self._group_state_cache = {}
+        # Group page that was current before the last tab change.
+        self._active_group_page = None
+        self._window_title_path = None
+        self._session_write_executor = None
+        self._session_autosave_timer = QTimer(self)
+        self._session_autosave_timer.setSingleShot(True)
+        self._session_autosave_timer.setInterval(2000)
+        self._session_autosave_timer.timeout.connect(self.autosave_session_state)
+        self.sessionWriteFailed.connect(self.mark_session_dirty)
         self._restored_splitter_sizes = False
         self._shutdown_prepared = False
         self._local_office_sync_check_in_progress = False
@@ -87,7 +119,8 @@ class MainWindow(QMainWindow):
         self.ui = loader.load(str(ui_path))
         if self.ui is None:
             raise RuntimeError(f"Konnte UI nicht laden: {ui_path}")
-        self.update_window_title(QDir.homePath())
+        self._splitter = self.ui.findChild(QSplitter, "splitter")
+        self.update_window_title(self._home_path)
 
         if self.ui.menuBar():
             self.ui.menuBar().hide()
@@ -96,11 +129,10 @@ class MainWindow(QMainWindow):
         app = QApplication.instance()
         if app is not None:
             app.aboutToQuit.connect(self.persist_app_state)
-            app.focusChanged.connect(self.on_app_focus_changed)
 
+        # No setRootPath here: every pane sets the shared model's root when it
+        # navigates, starting with group 0's first tab in setup_group_tabs.
         self.model = FileSystemModel()
-        root_path = QDir.homePath()
-        self.model.setRootPath(root_path)
         self.model.setReadOnly(False)
         self.model.setFilter(QDir.Filter.AllEntries | QDir.NoDotAndDotDot)
 
@@ -113,9 +145,8 @@ class MainWindow(QMainWindow):
 
         QTimer.singleShot(0, self.focus_active_tree_view)
 
-        splitter = self.ui.findChild(QSplitter, "splitter")
-        if splitter and not self._restored_splitter_sizes:
-            splitter.setSizes([200, 1000])
+        if self._splitter and not self._restored_splitter_sizes:
+            self._splitter.setSizes([200, 1000])
 
     def initialize_storage_paths(self):
         app_dir_name = APP_NAME.lower()
@@ -142,12 +173,15 @@ class MainWindow(QMainWindow):
         self.migrate_legacy_json_if_needed()
 
     def migrate_legacy_json_if_needed(self):
-        legacy_base = Path(__file__).resolve().parent / 'models'
+        legacy_base = _MODULE_DIR / 'models'
         migration_map = {
             legacy_base / 'navigator.json': self.navigator_data_path,
             legacy_base / 'session.json': self.session_data_path,
         }
 
+        # Checked on every start: a legacy file may still show up later (e.g.
+        # copied back from an old install). The target is checked first since
+        # after the first migration it exists and the legacy file is never read.
         for legacy_path, target_path in migration_map.items():
             if target_path.exists() or not legacy_path.exists():
                 continue
@@ -174,6 +208,9 @@ class MainWindow(QMainWindow):
             content_layout.setContentsMargins(0, 0, 0, 0)
             content_layout.setSpacing(0)
             self.group_content_host.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self._group_stack = QStackedWidget(self.group_content_host)
+        self._group_stack.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.group_content_host.layout().addWidget(self._group_stack, 1)
 
         self.group_tabs.setMovable(True)
         self.group_tabs.tabCloseRequested.connect(self.on_group_tab_close_requested)
@@ -182,6 +219,8 @@ class MainWindow(QMainWindow):
         self.group_tabs.tabBar().installEventFilter(self)
         self.group_tabs.tabBar().tabBarDoubleClicked.connect(self.on_group_tab_bar_double_clicked)
 
+        from controllers.group_controller import GroupController
+
         self.group_controller = GroupController(
             group_tabs=self.group_tabs,
             model=self.model,
@@ -208,10 +247,16 @@ class MainWindow(QMainWindow):
             self.update_window_title(active_pane.current_path())
             self.update_nav_buttons()
 
-    def _group_menu_icon(self, theme_name, fallback_pixmap):
-        icon = QIcon.fromTheme(theme_name)
-        if icon.isNull():
-            icon = self.ui.style().standardIcon(fallback_pixmap)
+    def _themed_icon(self, theme_name, fallback_pixmap, alternate_theme_name=None):
+        key = (theme_name, alternate_theme_name, fallback_pixmap)
+        icon = MainWindow._icon_cache.get(key)
+        if icon is None:
+            icon = QIcon.fromTheme(theme_name)
+            if icon.isNull() and alternate_theme_name:
+                icon = QIcon.fromTheme(alternate_theme_name)
+            if icon.isNull():
+                icon = self.ui.style().standardIcon(fallback_pixmap)
+            MainWindow._icon_cache[key] = icon
         return icon
 
     def get_active_pane(self):
@@ -223,10 +268,7 @@ class MainWindow(QMainWindow):
     def get_page_for_pane(self, target_pane):
         if not self.group_controller:
             return None
-        for page, pane in self.group_controller.group_panes_by_page.items():
-            if pane is target_pane:
-                return page
-        return None
+        return self.group_controller.page_by_pane.get(target_pane)
 
     def export_split_state_for_page(self, page):
         pane = self.group_controller.group_panes_by_page.get(page) if self.group_controller else None
@@ -261,6 +303,25 @@ class MainWindow(QMainWindow):
         if _new is not None:
             self.schedule_local_office_web_sync_check()
 
+    def _set_focus_tracking(self, enabled):
+        # Focus changes only matter while the window is visible; a hidden or
+        # minimized window skips the per-change highlight/title refresh.
+        if enabled == self._focus_connected:
+            return
+        app = QApplication.instance()
+        if app is None:
+            return
+        if enabled:
+            app.focusChanged.connect(self.on_app_focus_changed)
+            self._focus_connected = True
+            self.on_app_focus_changed(None, None)
+            return
+        try:
+            app.focusChanged.disconnect(self.on_app_focus_changed)
+        except (TypeError, RuntimeError):
+            pass
+        self._focus_connected = False
+
     def schedule_local_office_web_sync_check(self):
         if self._local_office_sync_check_in_progress or self._local_office_sync_check_scheduled:
             return
@@ -393,6 +454,14 @@ class MainWindow(QMainWindow):
         return code in {"itemnotfound", "resourceNotFound".casefold()}
 
     def on_group_tab_changed(self, _index):
+        # The outgoing group's cached snapshot predates whatever was done
+        # while it was current (tabs, sorting, columns, scroll, selection);
+        # drop it so the next save exports that group once more.
+        self._group_state_cache.pop(self._active_group_page, None)
+        self._active_group_page = self.group_tabs.currentWidget() if self.group_tabs else None
+        self.mark_session_dirty()
+        if self.group_tabs:
+            self.materialize_pending_group(self.group_tabs.currentWidget())
         self.render_active_group_pane()
         self.update_split_active_highlight()
         active_pane = self.get_active_pane()
@@ -434,7 +503,7 @@ class MainWindow(QMainWindow):
             status_bar.clearMessage()
 
     def render_active_group_pane(self):
-        if not self.group_tabs or not self.group_content_host:
+        if not self.group_tabs or not self._group_stack:
             return
 
         active_page = self.group_tabs.currentWidget()
@@ -444,45 +513,24 @@ class MainWindow(QMainWindow):
         if not active_group:
             return
 
-        content_layout = self.group_content_host.layout()
-        while content_layout.count() > 0:
-            item = content_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        for pane in self.group_controller.group_panes_by_page.values():
-            pane.widget.setVisible(False)
-
-        active_group.widget.setParent(self.group_content_host)
+        # Group widgets join the stack the first time they are shown; deleted
+        # groups drop out of it on their own when the widget is destroyed.
+        if self._group_stack.indexOf(active_group.widget) < 0:
+            self._group_stack.addWidget(active_group.widget)
+        self._group_stack.setCurrentWidget(active_group.widget)
         active_group.widget.setVisible(True)
-        content_layout.addWidget(active_group.widget, 1)
         active_group.optimize_columns()
         self.update_split_active_highlight()
 
-    def set_single_view_mode(self):
-        active_pane = self.get_active_pane()
-        if not active_pane:
+    def set_view_mode(self, mode, _checked=False):
+        if mode not in {"single", "2-split", "4-split"}:
             return
-        active_pane.set_split_mode("single")
-        self.update_split_active_highlight()
-        self.update_nav_buttons()
-        self.update_window_title(active_pane.current_path())
-
-    def set_two_split_view_mode(self):
-        active_pane = self.get_active_pane()
-        if not active_pane:
-            return
-        active_pane.set_split_mode("2-split")
-        self.update_split_active_highlight()
-        self.update_nav_buttons()
-        self.update_window_title(active_pane.current_path())
-
-    def set_four_split_view_mode(self):
         active_pane = self.get_active_pane()
         if not active_pane:
             return
-        active_pane.set_split_mode("4-split")
+        active_pane.set_split_mode(mode)
+        self.mark_session_dirty()
+        self._invalidate_group_state(active_pane)
         self.update_split_active_highlight()
         self.update_nav_buttons()
         self.update_window_title(active_pane.current_path())
@@ -501,12 +549,15 @@ class MainWindow(QMainWindow):
     def is_group_header_area_click(self, pos):
         if not self.group_tabs:
             return False
+        return 0 <= pos.y() <= self._group_header_height
+
+    def _update_group_header_height(self):
         tab_bar = self.group_tabs.tabBar()
-        header_height = tab_bar.height() if tab_bar.isVisible() else 30
-        return 0 <= pos.y() <= header_height
+        self._group_header_height = tab_bar.height() if tab_bar.isVisible() else 30
 
     def create_group(self, title=None, start_path=None):
         debug_log(f"create_group(title={title}, start_path={start_path})")
+        self.mark_session_dirty()
         try:
             return self.group_controller.create_group(title=title, start_path=start_path) if self.group_controller else None
         except Exception as error:
@@ -551,7 +602,7 @@ class MainWindow(QMainWindow):
         if not create_path and source and hasattr(source, "current_path"):
             create_path = source.current_path()
         if not create_path:
-            create_path = QDir.homePath()
+            create_path = self._home_path
 
         target_pane = self.create_group(title=title, start_path=create_path)
         self._compact_group_zero_when_groups_visible()
@@ -560,7 +611,11 @@ class MainWindow(QMainWindow):
 
     def close_group(self, index, confirm=True):
         if self.group_controller:
+            if len(self.visible_group_indices()) == 1:
+                # The last group hands its tabs over to group 0, so it needs real panes.
+                self.materialize_pending_group(self.group_tabs.widget(index))
             self.group_controller.close_group(index, confirm=confirm)
+            self.mark_session_dirty()
 
     def on_group_tab_close_requested(self, index):
         if index > 0:
@@ -592,6 +647,7 @@ class MainWindow(QMainWindow):
         debug_log(f"rename_group(index={index})")
         if self.group_controller:
             self.group_controller.rename_group(index)
+            self.mark_session_dirty()
 
     def refresh_group_tabs_presentation(self):
         if self.group_controller:
@@ -610,19 +666,16 @@ class MainWindow(QMainWindow):
     def can_offer_grouping(self, pane_controller):
         return self.group_controller.can_offer_grouping(pane_controller) if self.group_controller else False
 
-    def on_pane_group_requested(self):
-        source_pane = self.sender()
-        if not isinstance(source_pane, GroupWorkspaceWidget):
-            source_pane = self.get_active_pane()
-        self._group_from_pane(source_pane)
+    def on_pane_group_requested(self, source_pane=None):
+        self._group_from_pane(source_pane or self.get_active_pane())
 
     def _group_from_pane(self, source_pane):
-        if not isinstance(source_pane, GroupWorkspaceWidget):
+        if source_pane is None:
             return
         if not self.can_offer_grouping(source_pane):
             return
 
-        moved_states, active_index = source_pane.move_tabs_out_and_reset(QDir.homePath())
+        moved_states, active_index = source_pane.move_tabs_out_and_reset(self._home_path)
         if not moved_states:
             return
 
@@ -639,36 +692,37 @@ class MainWindow(QMainWindow):
         if not self.group_tabs:
             return None
 
+        active_page = self.group_tabs.currentWidget()
+        state_cache = {}
+
         group_zero_pane = self.get_group_zero_pane()
         group_zero_state = None
         group_zero_page = None
         if self.group_tabs and self.group_tabs.count() > 0:
             group_zero_page = self.group_tabs.widget(0)
         if group_zero_pane:
-            group_zero_state = {
-                "pane": group_zero_pane.export_state(),
-                **(self.export_split_state_for_page(group_zero_page) if group_zero_page else {"split_mode": "single"}),
-            }
+            if group_zero_page is not None:
+                group_zero_state = self._group_state_snapshot(group_zero_page, group_zero_pane, active_page, state_cache)
+            else:
+                group_zero_state = {"pane": group_zero_pane.export_state(), "split_mode": "single"}
 
         groups_payload = []
-        for index in self.visible_group_indices():
-            page = self.group_tabs.widget(index)
-            pane = self.group_controller.group_panes_by_page.get(page) if self.group_controller else None
-            if not pane:
+        visible_groups = self.group_controller.iter_visible_groups() if self.group_controller else ()
+        for index, page, pane, pending_state in visible_groups:
+            if pane is None and pending_state is None:
                 continue
 
-            group_icon = ""
-            if page is not None:
-                group_icon = str(page.property("group_icon") or "").strip()
-
-            groups_payload.append(
-                {
-                    "title": self.group_tabs.tabText(index).strip() or f"Gruppe {index}",
-                    "icon": group_icon,
-                    "pane": pane.export_state(),
-                    **self.export_split_state_for_page(page),
-                }
-            )
+            group_entry = {
+                "title": self.group_tabs.tabText(index).strip() or f"Gruppe {index}",
+                "icon": str(page.property("group_icon") or "").strip() if page is not None else "",
+            }
+            if pane is None:
+                groups_payload.append({**pending_state.raw, **group_entry})
+                continue
+
+            group_entry.update(self._group_state_snapshot(page, pane, active_page, state_cache))
+            groups_payload.append(group_entry)
+        self._group_state_cache = state_cache
 
         payload = {
             "version": 1,
@@ -686,140 +740,174 @@ class MainWindow(QMainWindow):
             "maximized": self.ui.isMaximized(),
         }
 
-        splitter = self.ui.findChild(QSplitter, "splitter")
-        if splitter:
-            payload["splitter_sizes"] = splitter.sizes()
+        if self._splitter:
+            payload["splitter_sizes"] = self._splitter.sizes()
 
         return payload
 
-    def apply_session_payload(self, payload):
-        if not isinstance(payload, dict):
-            return False
-
-        window_data = payload.get("window")
-        if isinstance(window_data, dict):
-            try:
-                x = int(window_data.get("x", 100))
-                y = int(window_data.get("y", 100))
-                width = int(window_data.get("width", 1200))
-                height = int(window_data.get("height", 800))
-                if width > 0 and height > 0:
-                    self.ui.setGeometry(x, y, width, height)
-                if bool(window_data.get("maximized", False)):
-                    self.ui.setWindowState(self.ui.windowState() | Qt.WindowState.WindowMaximized)
-            except (TypeError, ValueError):
-                pass
+    def _group_state_snapshot(self, page, pane, active_page, state_cache):
+        # Hidden groups cannot change scroll position or selection, and their
+        # navigation invalidates the entry (see _invalidate_group_state), so
+        # only the visible group has to be exported on every save.
+        snapshot = self._group_state_cache.get(page)
+        if snapshot is None or page is active_page:
+            snapshot = {
+                "pane": pane.export_state(),
+                **self.export_split_state_for_page(page),
+            }
+        state_cache[page] = snapshot
+        return snapshot
 
-        raw_splitter_sizes = payload.get("splitter_sizes")
-        splitter = self.ui.findChild(QSplitter, "splitter")
-        if splitter and isinstance(raw_splitter_sizes, list):
-            try:
-                splitter_sizes = [int(size) for size in raw_splitter_sizes if int(size) > 0]
-            except (TypeError, ValueError):
-                splitter_sizes = []
+    def _invalidate_group_state(self, pane):
+        if self.group_controller is None or not self._group_state_cache:
+            return
+        page = self.group_controller.page_by_pane.get(pane)
+        if page is not None:
+            self._group_state_cache.pop(page, None)
 
-            if splitter_sizes:
-                splitter.setSizes(splitter_sizes)
-                self._restored_splitter_sizes = True
+    def apply_session_payload(self, payload):
+        session = SessionPayload.from_dict(payload)
+        if session is None:
+            return False
 
-        self.clear_visible_groups()
+        self.apply_session_window_payload(session)
+        self.apply_session_groups_payload(session)
+        return True
 
-        group_zero_pane = self.get_group_zero_pane()
-        group_zero_payload = payload.get("group0")
-        if group_zero_pane and isinstance(group_zero_payload, dict):
-            if isinstance(group_zero_payload.get("tabs"), list):
-                group_zero_pane.import_state(group_zero_payload)
-                group_zero_page = self.group_tabs.widget(0) if self.group_tabs.count() > 0 else None
-                if group_zero_page is not None:
-                    self.restore_split_state_for_page(group_zero_page, "single", None)
-            else:
-                pane_payload = group_zero_payload.get("pane")
-                split_mode = str(group_zero_payload.get("split_mode") or "single")
-                secondary_payload = group_zero_payload.get("secondary_pane")
-                tertiary_payload = group_zero_payload.get("tertiary_pane")
-                quaternary_payload = group_zero_payload.get("quaternary_pane")
+    def apply_session_window_payload(self, session: SessionPayload):
+        window = session.window
+        if window is not None:
+            if window.width > 0 and window.height > 0:
+                self.ui.setGeometry(window.x, window.y, window.width, window.height)
+            if window.maximized:
+                self.ui.setWindowState(self.ui.windowState() | Qt.WindowState.WindowMaximized)
+
+        if self._splitter and session.splitter_sizes:
+            self._splitter.setSizes(session.splitter_sizes)
+            self._restored_splitter_sizes = True
+
+    def apply_session_groups_payload(self, session: SessionPayload):
+        # The group tabs are rebuilt wholesale below; keep currentChanged quiet
+        # while that happens and run the tab-change handling once at the end.
+        tabs_were_blocked = self.group_tabs.blockSignals(True)
+        try:
+            self.clear_visible_groups()
 
-                if isinstance(pane_payload, dict):
-                    group_zero_pane.import_state(pane_payload)
+            group_zero_pane = self.get_group_zero_pane()
+            group_zero = session.group_zero
+            if group_zero_pane and group_zero is not None:
+                if group_zero.pane is not None:
+                    group_zero_pane.import_state(group_zero.pane)
 
                 group_zero_page = self.group_tabs.widget(0) if self.group_tabs.count() > 0 else None
                 if group_zero_page is not None:
                     self.restore_split_state_for_page(
                         group_zero_page,
-                        split_mode,
-                        secondary_payload,
-                        tertiary_payload,
-                        quaternary_payload,
+                        group_zero.split_mode,
+                        group_zero.secondary_pane,
+                        group_zero.tertiary_pane,
+                        group_zero.quaternary_pane,
                     )
 
-        raw_groups = payload.get("groups")
-        if isinstance(raw_groups, list):
-            for group_data in raw_groups:
-                if not isinstance(group_data, dict):
-                    continue
-
-                title = str(group_data.get("title") or "").strip() or None
-                icon_value = str(group_data.get("icon") or "").strip()
-                pane_data = group_data.get("pane")
-                split_mode = str(group_data.get("split_mode") or "single")
-                secondary_payload = group_data.get("secondary_pane")
-                tertiary_payload = group_data.get("tertiary_pane")
-                quaternary_payload = group_data.get("quaternary_pane")
-
-                start_path = QDir.homePath()
-                if isinstance(pane_data, dict):
-                    tabs = pane_data.get("tabs")
-                    if isinstance(tabs, list) and tabs:
-                        first_tab = tabs[0]
-                        if isinstance(first_tab, dict):
-                            candidate = QDir.cleanPath(str(first_tab.get("path") or ""))
-                            if candidate and QDir(candidate).exists():
-                                start_path = candidate
-
-                pane = self.create_group(title=title, start_path=start_path)
-                if pane and isinstance(pane_data, dict):
-                    pane.import_state(pane_data)
-
-                if pane:
-                    page = self.get_page_for_pane(pane)
-                    if page is not None:
-                        page.setProperty("group_icon", icon_value)
-                        self.restore_split_state_for_page(
-                            page,
-                            split_mode,
-                            secondary_payload,
-                            tertiary_payload,
-                            quaternary_payload,
-                        )
-
-        raw_active_group_index = payload.get("active_group_index", 0)
-        try:
-            active_group_index = int(raw_active_group_index)
-        except (TypeError, ValueError):
-            active_group_index = 0
+            if self.group_controller:
+                # Only the tabs are created here; a group's panes are built the
+                # first time it is activated (see materialize_pending_group).
+                for group in session.groups:
+                    self.group_controller.create_pending_group(group.title, group.icon, group)
 
-        active_group_index = max(0, min(active_group_index, self.group_tabs.count() - 1))
-        self.group_tabs.setCurrentIndex(active_group_index)
+            active_group_index = max(0, min(session.active_group_index, self.group_tabs.count() - 1))
+            self.group_tabs.setCurrentIndex(active_group_index)
+        finally:
+            self.group_tabs.blockSignals(tabs_were_blocked)
+
+        self._group_state_cache.clear()
         self._compact_group_zero_when_groups_visible()
         self.refresh_group_tabs_presentation()
-        self.update_nav_buttons()
+        self.on_group_tab_changed(self.group_tabs.currentIndex())
 
-        active_pane = self.get_active_pane()
-        if active_pane:
-            self.update_window_title(active_pane.current_path())
+    def materialize_pending_group(self, page):
+        if not self.group_controller:
+            return False
+        pane, group = self.group_controller.materialize_pending_group(page)
+        if pane is None:
+            return False
 
+        start_path = self._home_path
+        candidate = QDir.cleanPath(group.first_tab_path) if group.first_tab_path else ""
+        if candidate and os.path.isdir(candidate):
+            start_path = candidate
+
+        pane.navigate_to(start_path, push_history=False)
+        if group.pane is not None:
+            pane.import_state(group.pane)
+        self.restore_split_state_for_page(
+            page,
+            group.split_mode,
+            group.secondary_pane,
+            group.tertiary_pane,
+            group.quaternary_pane,
+        )
         return True
 
-    def save_session_state(self):
+    def mark_session_dirty(self):
+        self._session_dirty = True
+        if not self._shutdown_prepared and not self._session_autosave_timer.isActive():
+            self._session_autosave_timer.start()
+
+    def autosave_session_state(self):
+        if not self._session_dirty or self._shutdown_prepared:
+            return
+        try:
+            self.save_session_state(wait=False)
+        except OSError as error:
+            debug_exception("MainWindow.autosave_session_state failed", error)
+
+    def save_session_state(self, wait=True):
+        if self._session_restore_pending:
+            # Saving before the deferred restore ran would overwrite the stored groups.
+            return
         payload = self.build_session_payload()
         if payload is None:
             return
 
+        payload_bytes = dumps_json_bytes(payload)
+        self._session_dirty = False
+        if payload_bytes == self._last_saved_session_bytes:
+            return
+
+        # The payload is built on the GUI thread; the write and fsync go to a
+        # single writer thread so autosaves never stall the UI and writes stay
+        # in order. Callers that need the file on disk (shutdown) wait for it.
+        self._last_saved_session_bytes = payload_bytes
+        future = self._session_writer().submit(self._write_session_bytes, payload_bytes)
+        if not wait:
+            future.add_done_callback(self._on_session_write_done)
+            return
+        try:
+            future.result()
+        except OSError:
+            self._last_saved_session_bytes = None
+            raise
+
+    def _session_writer(self):
+        if self._session_write_executor is None:
+            self._session_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-writer")
+        return self._session_write_executor
+
+    def _write_session_bytes(self, payload_bytes):
         self.session_data_path.parent.mkdir(parents=True, exist_ok=True)
-        self.session_data_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        write_bytes_atomic(self.session_data_path, payload_bytes)
+
+    def _on_session_write_done(self, future):
+        error = future.exception()
+        if error is None:
+            return
+        # Runs on the writer thread. Forgetting the bytes lets the retry write
+        # an unchanged payload; the signal re-marks the session dirty and
+        # restarts the autosave timer on the GUI thread.
+        self._last_saved_session_bytes = None
+        debug_exception("MainWindow.save_session_state background write failed", error)
+        self.sessionWriteFailed.emit()
 
     def load_session_state(self):
         if not self.group_tabs:
@@ -828,11 +916,23 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            payload = json.loads(self.session_data_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            session = SessionPayload.from_dict(loads_json_bytes(self.session_data_path.read_bytes()))
+        except (ValueError, OSError):
+            return
+        if session is None:
             return
 
-        self.apply_session_payload(payload)
+        # Geometry is applied right away so the window does not jump after it
+        # is shown; rebuilding the groups is deferred until after first paint.
+        self.apply_session_window_payload(session)
+        self._session_restore_pending = True
+        QTimer.singleShot(0, lambda: self._restore_session_groups(session))
+
+    def _restore_session_groups(self, session: SessionPayload):
+        self._session_restore_pending = False
+        if self._shutdown_prepared:
+            return
+        self.apply_session_groups_payload(session)
 
     def cleanup_stale_local_office_web_sessions(self, max_age_days: int = 7):
         if self.local_office_web_session_store is None or self.remote_drive_controller is None:
@@ -864,10 +964,10 @@ class MainWindow(QMainWindow):
         }
 
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        target_path.write_text(json.dumps(bundle, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_bytes_atomic(target_path, dumps_json_bytes(bundle))
 
     def import_session_bundle(self, source_path: Path):
-        payload = json.loads(source_path.read_text(encoding="utf-8"))
+        payload = loads_json_bytes(source_path.read_bytes())
         if not isinstance(payload, dict):
             raise ValueError("Ungültige Datei")
 
@@ -900,7 +1000,9 @@ class MainWindow(QMainWindow):
             self.update_window_title(active_pane.current_path())
 
         if self.navigator_manager:
-            default_nav = copy.deepcopy(DEFAULT_NAVIGATOR_DATA)
+            from models.navigator import default_navigator_data
+
+            default_nav = default_navigator_data()
             self.navigator_manager.save_data(default_nav)
             self.navigator_manager.widget.clear()
             self.navigator_manager.loaded_data = default_nav
@@ -910,14 +1012,18 @@ class MainWindow(QMainWindow):
         if self.navigator_manager:
             self.navigator_manager.save_current_state()
 
-    def on_pane_path_changed(self, path):
-        if self.sender() != self.get_active_pane():
+    def on_pane_path_changed(self, pane, path):
+        self.mark_session_dirty()
+        self._invalidate_group_state(pane)
+        if pane is not self.get_active_pane():
             return
         self.update_window_title(path)
         self._update_temporary_context_notice(path)
 
-    def on_pane_navigation_changed(self, _can_back, _can_up):
-        if self.sender() != self.get_active_pane():
+    def on_pane_navigation_changed(self, pane, _can_back, _can_up):
+        self.mark_session_dirty()
+        self._invalidate_group_state(pane)
+        if pane is not self.get_active_pane():
             return
 
     def update_nav_buttons(self):
@@ -929,15 +1035,28 @@ class MainWindow(QMainWindow):
         self._persisted_once = True
 
         debug_log("persist_app_state called")
+        self._session_autosave_timer.stop()
+        # Not every pane mutation (background tabs, sorting, window geometry)
+        # marks the session dirty, so always build the payload here and let
+        # save_session_state skip the write when nothing actually changed.
         self.save_session_state()
         if self.navigator_manager:
             self.navigator_manager.save_current_state()
+            self.navigator_manager.flush_pending_save()
 
     def eventFilter(self, watched, event):
         try:
-            if watched == self.ui and event.type() == QEvent.Type.Close:
-                self.persist_app_state()
-                self.prepare_for_shutdown()
+            if watched == self.ui:
+                event_type = event.type()
+                if event_type == QEvent.Type.Close:
+                    self.persist_app_state()
+                    self.prepare_for_shutdown()
+                elif event_type in (QEvent.Type.Resize, QEvent.Type.Move):
+                    self.mark_session_dirty()
+                elif event_type == QEvent.Type.Show:
+                    self._set_focus_tracking(True)
+                elif event_type == QEvent.Type.Hide:
+                    self._set_focus_tracking(False)
 
             if self.group_tabs and watched == self.group_tabs:
                 if event.type() == QEvent.Type.MouseButtonDblClick and event.button() == Qt.MouseButton.LeftButton:
@@ -957,10 +1076,15 @@ class MainWindow(QMainWindow):
                         tab_index = tab_bar.tabAt(tab_bar_pos)
                         if not tab_bar.isVisible() and tab_index < 0:
                             tab_index = -1
-                        if self._show_group_tabs_context_menu(self.group_tabs, event.globalPos(), tab_index):
+                        if self._show_group_tabs_context_menu(event.globalPos(), tab_index):
                             return True
 
             if self.group_tabs and watched == self.group_tabs.tabBar():
+                if event.type() in (QEvent.Type.Resize, QEvent.Type.Show):
+                    self._update_group_header_height()
+                elif event.type() == QEvent.Type.Hide:
+                    self._group_header_height = 30
+
                 if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.MiddleButton:
                     tab_bar = self.group_tabs.tabBar()
                     global_pos = event.globalPosition().toPoint()
@@ -973,7 +1097,7 @@ class MainWindow(QMainWindow):
                 if event.type() == QEvent.Type.ContextMenu:
                     tab_bar = self.group_tabs.tabBar()
                     tab_index = tab_bar.tabAt(event.pos())
-                    if self._show_group_tabs_context_menu(tab_bar, event.globalPos(), tab_index):
+                    if self._show_group_tabs_context_menu(event.globalPos(), tab_index):
                         return True
                     return True
 
@@ -981,33 +1105,39 @@ class MainWindow(QMainWindow):
         except RuntimeError:
             return False
 
-    def _show_group_tabs_context_menu(self, anchor_widget, global_pos, tab_index):
-        menu = QMenu(anchor_widget)
-        action_new_group = menu.addAction(
-            self._group_menu_icon("folder-new", QStyle.StandardPixmap.SP_FileDialogNewFolder),
+    def _ensure_group_tabs_menu(self):
+        if self._group_tabs_menu is not None:
+            return self._group_tabs_menu
+
+        menu = QMenu(self.group_tabs)
+        self._action_new_group = menu.addAction(
+            self._themed_icon("folder-new", QStyle.StandardPixmap.SP_FileDialogNewFolder),
             app_tr("MainWindow", "Neue Gruppe"),
         )
-        action_rename_group = None
-        if tab_index > 0:
-            action_rename_group = menu.addAction(
-                self._group_menu_icon("edit-rename", QStyle.StandardPixmap.SP_FileDialogDetailedView),
-                app_tr("MainWindow", "Umbenennen"),
-            )
-        action_close_group = None
-        if tab_index > 0:
-            action_close_group = menu.addAction(
-                self._group_menu_icon("window-close", QStyle.StandardPixmap.SP_DialogCloseButton),
-                app_tr("MainWindow", "Gruppe schließen"),
-            )
+        self._action_rename_group = menu.addAction(
+            self._themed_icon("edit-rename", QStyle.StandardPixmap.SP_FileDialogDetailedView),
+            app_tr("MainWindow", "Umbenennen"),
+        )
+        self._action_close_group = menu.addAction(
+            self._themed_icon("window-close", QStyle.StandardPixmap.SP_DialogCloseButton),
+            app_tr("MainWindow", "Gruppe schließen"),
+        )
+        self._group_tabs_menu = menu
+        return menu
+
+    def _show_group_tabs_context_menu(self, global_pos, tab_index):
+        menu = self._ensure_group_tabs_menu()
+        self._action_rename_group.setVisible(tab_index > 0)
+        self._action_close_group.setVisible(tab_index > 0)
 
         chosen_action = menu.exec(global_pos)
-        if chosen_action == action_new_group:
+        if chosen_action is self._action_new_group:
             self.create_group_from_context()
             return True
-        if action_rename_group is not None and chosen_action == action_rename_group:
+        if tab_index > 0 and chosen_action is self._action_rename_group:
             self.rename_group(tab_index)
             return True
-        if action_close_group is not None and chosen_action == action_close_group:
+        if tab_index > 0 and chosen_action is self._action_close_group:
             self.close_group(tab_index)
             return True
         return bool(chosen_action)
@@ -1019,12 +1149,8 @@ class MainWindow(QMainWindow):
         if left_toolbar is not None:
             left_toolbar.hide()
 
-        style = self.ui.style()
-
         if self.btn_nav_menu:
-            menu_icon = QIcon.fromTheme("application-menu")
-            if menu_icon.isNull():
-                menu_icon = style.standardIcon(QStyle.StandardPixmap.SP_TitleBarMenuButton)
+            menu_icon = self._themed_icon("application-menu", QStyle.StandardPixmap.SP_TitleBarMenuButton)
             self.btn_nav_menu.setIcon(menu_icon)
             self.btn_nav_menu.setText("")
             self.btn_nav_menu.setToolTip(app_tr("MainWindow", "Menü"))
@@ -1033,22 +1159,16 @@ class MainWindow(QMainWindow):
             self.btn_nav_menu.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
 
             burger_menu = QMenu(self.btn_nav_menu)
-            settings_icon = QIcon.fromTheme("preferences-system")
-            if settings_icon.isNull():
-                settings_icon = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView)
+            settings_icon = self._themed_icon("preferences-system", QStyle.StandardPixmap.SP_FileDialogDetailedView)
             self._action_settings = burger_menu.addAction(settings_icon, app_tr("MainWindow", "Einstellungen"))
             self._action_settings.triggered.connect(self.show_settings_dialog)
-            info_icon = QIcon.fromTheme("help-about")
-            if info_icon.isNull():
-                info_icon = style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
+            info_icon = self._themed_icon("help-about", QStyle.StandardPixmap.SP_MessageBoxInformation)
             self._action_info = burger_menu.addAction(info_icon, app_tr("MainWindow", "Über / Info"))
             self._action_info.triggered.connect(self.show_about_info)
 
             burger_menu.addSeparator()
 
-            quit_icon = QIcon.fromTheme("application-exit")
-            if quit_icon.isNull():
-                quit_icon = style.standardIcon(QStyle.StandardPixmap.SP_TitleBarCloseButton)
+            quit_icon = self._themed_icon("application-exit", QStyle.StandardPixmap.SP_TitleBarCloseButton)
             self._action_quit = burger_menu.addAction(quit_icon, app_tr("MainWindow", "Beenden"))
             self._action_quit.setShortcut(QKeySequence.StandardKey.Quit)
             self._action_quit.setShortcutVisibleInContextMenu(True)
@@ -1056,11 +1176,11 @@ class MainWindow(QMainWindow):
             self.btn_nav_menu.setMenu(burger_menu)
 
         if self.btn_split_view:
-            split_icon = QIcon.fromTheme("view-split-left-right")
-            if split_icon.isNull():
-                split_icon = QIcon.fromTheme("view-grid")
-            if split_icon.isNull():
-                split_icon = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogListView)
+            split_icon = self._themed_icon(
+                "view-split-left-right",
+                QStyle.StandardPixmap.SP_FileDialogListView,
+                alternate_theme_name="view-grid",
+            )
 
             self.btn_split_view.setIcon(split_icon)
             self.btn_split_view.setText("")
@@ -1074,9 +1194,9 @@ class MainWindow(QMainWindow):
             split_menu.addSeparator()
             self._action_split_2 = split_menu.addAction(app_tr("MainWindow", "2-Split"))
             self._action_split_4 = split_menu.addAction(app_tr("MainWindow", "4-Split"))
-            self._action_split_single.triggered.connect(lambda: self.on_split_view_selected("single"))
-            self._action_split_2.triggered.connect(lambda: self.on_split_view_selected("2-split"))
-            self._action_split_4.triggered.connect(lambda: self.on_split_view_selected("4-split"))
+            self._action_split_single.triggered.connect(partial(self.set_view_mode, "single"))
+            self._action_split_2.triggered.connect(partial(self.set_view_mode, "2-split"))
+            self._action_split_4.triggered.connect(partial(self.set_view_mode, "4-split"))
             self.btn_split_view.setMenu(split_menu)
 
     def retranslate_ui_texts(self):
@@ -1097,6 +1217,10 @@ class MainWindow(QMainWindow):
             self._action_split_2.setText(app_tr("MainWindow", "2-Split"))
         if self._action_split_4 is not None:
             self._action_split_4.setText(app_tr("MainWindow", "4-Split"))
+        if self._group_tabs_menu is not None:
+            self._action_new_group.setText(app_tr("MainWindow", "Neue Gruppe"))
+            self._action_rename_group.setText(app_tr("MainWindow", "Umbenennen"))
+            self._action_close_group.setText(app_tr("MainWindow", "Gruppe schließen"))
 
         active_pane = self.get_active_pane()
         if active_pane is not None:
@@ -1107,6 +1231,8 @@ class MainWindow(QMainWindow):
         if not navigator_widget:
             return
 
+        from models.navigator import NavigatorManager
+
         self.navigator_manager = NavigatorManager(
             navigator_widget,
             self.navigator_data_path,
@@ -1129,7 +1255,7 @@ class MainWindow(QMainWindow):
         self.action_group = QAction(self.ui)
         self.action_group.setShortcut(QKeySequence("Ctrl+G"))
         self.action_group.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
-        self.action_group.triggered.connect(self.on_pane_group_requested)
+        self.action_group.triggered.connect(lambda _checked=False: self.on_pane_group_requested())
         self.ui.addAction(self.action_group)
     
     def on_nav_click(self, item):
@@ -1167,6 +1293,9 @@ class MainWindow(QMainWindow):
             self.navigator_manager.refresh()
 
     def update_window_title(self, path):
+        if path == self._window_title_path:
+            return
+        self._window_title_path = path
         normalized = QDir.cleanPath(path)
         self.ui.setWindowTitle(f"{normalized} - {APP_NAME}")
 
@@ -1192,17 +1321,6 @@ class MainWindow(QMainWindow):
         if tree_view is not None:
             tree_view.setFocus()
 
-    def on_split_view_selected(self, mode):
-        if mode == "single":
-            self.set_single_view_mode()
-            return
-        if mode == "2-split":
-            self.set_two_split_view_mode()
-            return
-        if mode == "4-split":
-            self.set_four_split_view_mode()
-            return
-
     def closeEvent(self, event):
         debug_log("MainWindow.closeEvent received")
         self.persist_app_state()
@@ -1218,6 +1336,11 @@ class MainWindow(QMainWindow):
         if self._shutdown_prepared:
             return
         self._shutdown_prepared = True
+        self._session_autosave_timer.stop()
+        self._set_focus_tracking(False)
+        if self._session_write_executor is not None:
+            self._session_write_executor.shutdown(wait=True)
+            self._session_write_executor = None
 
         self.cleanup_stale_local_office_web_sessions()
 
@@ -1296,6 +1419,8 @@ class MainWindow(QMainWindow):
                 self._settings_dialog.activateWindow()
                 return
 
+            from widgets.settings_dialog import SettingsDialog
+
             parent_widget = self.ui if isinstance(self.ui, QWidget) else self
             self._settings_dialog = SettingsDialog(
                 parent_widget,
@@ -1475,9 +1600,9 @@ def main(argv=None):
 
     def _global_excepthook(exc_type, exc_value, exc_traceback):
         try:
-            details = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-            debug_log(f"UNHANDLED EXCEPTION: {details}")
+            debug_unhandled_exception(exc_type, exc_value, exc_traceback)
         except Exception:
+            # Logging must never turn an unhandled exception into a second crash.
             pass
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
 
@@ -1497,14 +1622,9 @@ def main(argv=None):
     setup_localization(app, language_pref)
     icon = QIcon.fromTheme("system-file-manager")
     if icon.isNull():
-        project_root = Path(__file__).resolve().parent.parent
-        icon_candidates = [
-            project_root / "assets" / "tablion-icon.png",
-            project_root / "assets" / "tablion-icon.svg",
-        ]
-        for icon_path in icon_candidates:
-            if icon_path.exists():
-                icon = QIcon(str(icon_path))
+        for icon_path in _APP_ICON_CANDIDATES:
+            if os.path.isfile(icon_path):
+                icon = QIcon(icon_path)
                 if not icon.isNull():
                     break
     if not icon.isNull():
@@ -1513,7 +1633,8 @@ def main(argv=None):
     window = MainWindow()
     app.set_activation_window(window.ui)
     app.set_activation_handler(window.handle_activation_paths)
-    window.ui.setWindowIcon(app.windowIcon())
+    if not icon.isNull():
+        window.ui.setWindowIcon(icon)
     window.show()
     launch_paths = _collect_launch_paths(argv)
     if launch_paths:
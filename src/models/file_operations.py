@@ -1,17 +1,128 @@
 from __future__ import annotations
 
 import bz2
+import errno
 import gzip
 import importlib
 import lzma
+import os
 import shutil
+import stat
 import tarfile
+import tempfile
+import threading
+import time
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 from localization import app_tr
 
 
+# Errors from copy_file_range()/sendfile() that mean "not supported for these
+# two files" rather than a real I/O failure.
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    code
+    for code in (
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EINVAL,
+        errno.EBADF,
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "ETXTBSY", None),
+    )
+    if code is not None
+)
+_KERNEL_COPY_CHUNK_SIZE = 1 << 30
+_TREE_COPY_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Files at least this big get page-cache hints during copies; for small files
+# the extra fadvise() calls would cost more than they save.
+_FADVISE_MIN_SIZE = 64 << 20
+_RMTREE_AT_SUPPORTED = (
+    os.open in os.supports_dir_fd
+    and os.unlink in os.supports_dir_fd
+    and os.rmdir in os.supports_dir_fd
+    and os.scandir in os.supports_fd
+    and hasattr(os, "O_DIRECTORY")
+    and hasattr(os, "O_NOFOLLOW")
+)
+# Errors that Path.exists() treats as "does not exist".
+_MISSING_PATH_ERRNOS = frozenset((errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP))
+
+
+@lru_cache(maxsize=2048)
+def _absolute_path(value: str) -> Path:
+    # Shared by every pane's FileOperations: panes showing the same folders
+    # hand in the same strings over and over, so reuse one Path per string.
+    # Only absolute (or ~) input is cached since relative paths depend on the cwd.
+    return Path(os.path.abspath(os.path.expanduser(value)))
+
+
+class _StatCache:
+    """Short-lived LRU of stat() results, including misses, keyed by path string."""
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 1.0):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, os.stat_result | None]] = OrderedDict()
+        # Copies and moves run on a worker thread while the pane keeps using
+        # the same FileOperations instance.
+        self._lock = threading.Lock()
+
+    def stat(self, key: str, trust_miss: bool = True) -> os.stat_result | None:
+        """Return the stat() result for key, or None if it does not exist.
+
+        With trust_miss=False a cached "missing" entry is re-checked on disk;
+        only a cached hit is returned as is.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and now - cached[0] < self._ttl and (trust_miss or cached[1] is not None):
+                self._entries.move_to_end(key)
+                return cached[1]
+
+        try:
+            result = os.stat(key)
+        except OSError as error:
+            if error.errno not in _MISSING_PATH_ERRNOS:
+                raise
+            result = None
+
+        with self._lock:
+            self._entries[key] = (now, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def store(self, entries: dict[str, os.stat_result]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, result in entries.items():
+                self._entries[key] = (now, result)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self, keys) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                prefix = key.rstrip(os.sep) + os.sep
+                stale_keys = [cached_key for cached_key in self._entries if cached_key.startswith(prefix)]
+                for cached_key in stale_keys:
+                    del self._entries[cached_key]
+
+
 class FileOperations:
     _ARCHIVE_SUFFIX_GROUPS = (
         (".tar.gz", ".tgz"),
@@ -31,9 +142,39 @@ class FileOperations:
         ".tar.xz": "xztar",
     }
 
+    _send2trash = None
+
+    def __init__(self):
+        self._stat_cache = _StatCache()
+        # Directories this instance created or saw created; lets repeated
+        # copies into the same place skip makedirs() and its ancestor stats.
+        self._known_dirs: set[str] = set()
+        # Worker threads and the GUI thread share this instance.
+        self._known_dirs_lock = threading.Lock()
+
+    @classmethod
+    def _get_send2trash(cls):
+        if cls._send2trash is None:
+            try:
+                cls._send2trash = importlib.import_module("send2trash")
+            except ModuleNotFoundError as error:
+                raise RuntimeError(
+                    app_tr("FileOperations", "Papierkorb-Funktion ist nicht verfügbar (send2trash fehlt).")
+                ) from error
+        return cls._send2trash
+
     def _to_path(self, value: str | Path) -> Path:
         return Path(value).expanduser().resolve()
 
+    def _to_path_fast(self, value: str | Path) -> Path:
+        # copy/move/delete/rename get absolute, canonical paths from the views.
+        # Skip resolve(), which costs an lstat() per path component, and only
+        # make the path absolute. Symlinks are therefore handled as links.
+        text = os.fspath(value)
+        if text.startswith(("/", "~")):
+            return _absolute_path(text)
+        return Path(os.path.abspath(os.path.expanduser(text)))
+
     def _archive_suffix(self, value: str | Path) -> str | None:
         path = self._to_path(value)
         name = path.name.lower()
@@ -49,90 +190,560 @@ class FileOperations:
     def supported_archive_write_suffixes(self) -> tuple[str, ...]:
         return tuple(self._ARCHIVE_WRITE_FORMATS.keys())
 
-    def _resolve_destination(self, source: Path, destination: Path) -> Path:
-        if destination.exists() and destination.is_dir():
-            return destination / source.name
-        return destination
+    def _probe(self, path: str | Path) -> os.stat_result | None:
+        """Return the (cached) stat() result for path, or None if it does not exist.
+
+        Cached misses are trusted, which is only good enough for listing.
+        """
+        return self._stat_cache.stat(os.fspath(path))
+
+    def _probe_target(self, path: str | Path) -> os.stat_result | None:
+        """Like _probe(), but never trusts a cached miss.
+
+        Used for every path a user-initiated copy, move, delete or rename
+        touches. Destination checks guard plain rename() calls, which replace
+        an existing target silently, and a source reported missing would fail
+        the whole operation. Another pane, service or process may have
+        created either path since the miss was cached.
+        """
+        return self._stat_cache.stat(os.fspath(path), trust_miss=False)
+
+    def _invalidate_paths(self, *paths: str | Path) -> None:
+        keys = set()
+        for path in paths:
+            path_str = os.fspath(path)
+            keys.add(path_str)
+            keys.add(os.path.dirname(path_str))
+        self._stat_cache.invalidate(keys)
+        self._forget_known_dirs(paths)
+
+    def _ensure_dir(self, path: str | Path) -> None:
+        path_str = os.fspath(path)
+        with self._known_dirs_lock:
+            if path_str in self._known_dirs:
+                return
+        os.makedirs(path_str, exist_ok=True)
+        with self._known_dirs_lock:
+            self._known_dirs.add(path_str)
+
+    def _forget_known_dirs(self, paths) -> None:
+        with self._known_dirs_lock:
+            if not self._known_dirs:
+                return
+            for path in paths:
+                path_str = os.fspath(path)
+                prefix = path_str.rstrip(os.sep) + os.sep
+                stale = [known for known in self._known_dirs if known == path_str or known.startswith(prefix)]
+                self._known_dirs.difference_update(stale)
+
+    def _run_in_dir(self, directory: str | Path, action):
+        """Run action() after _ensure_dir(directory).
+
+        A directory remembered as created may have been removed since by
+        another pane or process. If action() then fails with
+        FileNotFoundError, the entry is dropped, the directory is created
+        again and the action is retried once.
+        """
+        directory_str = os.fspath(directory)
+        self._ensure_dir(directory_str)
+        try:
+            return action()
+        except FileNotFoundError:
+            with self._known_dirs_lock:
+                if directory_str not in self._known_dirs:
+                    raise
+                self._known_dirs.discard(directory_str)
+            if os.path.isdir(directory_str):
+                raise
+            self._ensure_dir(directory_str)
+            return action()
+
+    def scan(self, parent: str | Path) -> dict[str, os.stat_result]:
+        """Snapshot a directory's entries in one os.scandir() pass.
+
+        The returned stats do not follow symlinks. Non-symlink entries are also
+        fed to the stat cache so follow-up existence checks in the same
+        directory do not hit the disk again.
+        """
+        parent_path = str(parent)
+        with os.scandir(parent_path) as iterator:
+            scanned = {entry.name: entry.stat(follow_symlinks=False) for entry in iterator}
+
+        self._stat_cache.store(
+            {
+                os.path.join(parent_path, name): result
+                for name, result in scanned.items()
+                if not stat.S_ISLNK(result.st_mode)
+            }
+        )
+        return scanned
+
+    def invalidate_cache(self) -> None:
+        self._stat_cache.clear()
+        with self._known_dirs_lock:
+            self._known_dirs.clear()
+
+    def _resolve_destination(
+        self,
+        source: Path,
+        destination: Path,
+        scanned_parent: dict[str, os.stat_result] | None = None,
+    ) -> tuple[Path, os.stat_result | None]:
+        """Return the target path for source and its stat result (None if missing).
+
+        The source name is appended when destination is an existing directory.
+        scanned_parent is an optional scan() of destination's parent, as
+        copy_many() takes once per batch; when given, a missing or
+        non-symlink entry is answered from it directly.
+        """
+        destination_stat = None
+        if scanned_parent is not None:
+            destination_stat = scanned_parent.get(destination.name)
+            if destination_stat is None:
+                return destination, None
+            if stat.S_ISLNK(destination_stat.st_mode):
+                destination_stat = None
+
+        if destination_stat is None:
+            destination_stat = self._probe_target(destination)
+        if destination_stat is not None and stat.S_ISDIR(destination_stat.st_mode):
+            target = destination / source.name
+            return target, self._probe_target(target)
+        return destination, destination_stat
+
+    def _copy_fd_in_kernel(self, source_fd: int, target_fd: int) -> bool:
+        """Copy source_fd into target_fd without bouncing through userspace.
+
+        Returns False when neither copy_file_range() nor sendfile() can be
+        used for this pair of files and nothing has been written yet.
+        """
+        copied = 0
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is not None:
+            try:
+                while True:
+                    count = copy_file_range(source_fd, target_fd, _KERNEL_COPY_CHUNK_SIZE)
+                    if count == 0:
+                        return True
+                    copied += count
+            except OSError as error:
+                if copied or error.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                    raise
+
+        sendfile = getattr(os, "sendfile", None)
+        if sendfile is None:
+            return False
+        try:
+            while True:
+                count = sendfile(target_fd, source_fd, copied, _KERNEL_COPY_CHUNK_SIZE)
+                if count == 0:
+                    return True
+                copied += count
+        except OSError as error:
+            if copied or error.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+        return False
+
+    @staticmethod
+    def _fadvise(fd: int, advice_name: str) -> None:
+        posix_fadvise = getattr(os, "posix_fadvise", None)
+        advice = getattr(os, advice_name, None)
+        if posix_fadvise is None or advice is None:
+            return
+        try:
+            posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            # Purely a hint; some filesystems reject it.
+            pass
+
+    def _copy_file_fast(
+        self,
+        source: str,
+        target: str,
+        source_stat: os.stat_result,
+        exclusive: bool = False,
+    ) -> None:
+        # With exclusive=True the target is created with O_EXCL, so an existing
+        # file surfaces as FileExistsError from the open itself.
+        if not stat.S_ISREG(source_stat.st_mode):
+            # Opening a FIFO for reading would block until a writer shows up;
+            # refuse special files like shutil.copyfile() does.
+            raise shutil.SpecialFileError(f"`{source}` is not a regular file")
+        target_flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+        # O_NONBLOCK only matters if the path was swapped for a FIFO after the
+        # stat; for regular files it has no effect.
+        source_fd = os.open(source, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            target_fd = os.open(
+                target,
+                target_flags,
+                stat.S_IMODE(source_stat.st_mode) | stat.S_IWUSR,
+            )
+            advise = self._fadvise if source_stat.st_size >= _FADVISE_MIN_SIZE else None
+            try:
+                if advise is not None:
+                    advise(source_fd, "POSIX_FADV_SEQUENTIAL")
+                copied_in_kernel = self._copy_fd_in_kernel(source_fd, target_fd)
+                if advise is not None:
+                    # Neither side is read again soon; start writeback and let
+                    # the kernel drop both copies instead of evicting hot pages.
+                    advise(source_fd, "POSIX_FADV_DONTNEED")
+                    advise(target_fd, "POSIX_FADV_DONTNEED")
+            finally:
+                os.close(target_fd)
+        finally:
+            os.close(source_fd)
+
+        if not copied_in_kernel:
+            shutil.copyfile(source, target)
+        shutil.copystat(source, target)
+
+    def _copy_tree_parallel(self, source: str, target: str, concurrency: int = _TREE_COPY_WORKERS) -> None:
+        # Same semantics as shutil.copytree() with default arguments (symlinks
+        # are followed). Trees of many small files are bound by per-file
+        # syscall round-trips rather than bandwidth, so the directory skeleton
+        # is created here while several _copy_file_fast() calls stay in flight.
+        # Directory stats are applied deepest-first once their contents exist.
+        # Special files (FIFOs, sockets, devices) are reported the way
+        # copytree() does: collected and raised as shutil.Error at the end,
+        # never handed to a worker whose open() could block.
+        # When a folder is copied into one of its own subfolders the new
+        # target turns up inside the source; it is skipped by inode so the
+        # walk never descends into its own copy. Any other failure removes
+        # the partial target tree again.
+        directories: list[tuple[str, str]] = []
+        errors: list[tuple[str, str, str]] = []
+        target_root_stat = None
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tree-copy") as executor:
+                futures = []
+                pending_directories = [(source, target)]
+                while pending_directories:
+                    source_dir, target_dir = pending_directories.pop()
+                    # List the source before creating the target: when a folder is
+                    # copied into itself, the new target must not show up here.
+                    with os.scandir(source_dir) as iterator:
+                        entries = list(iterator)
+                    os.mkdir(target_dir, stat.S_IMODE(os.stat(source_dir).st_mode) | stat.S_IRWXU)
+                    if target_root_stat is None:
+                        target_root_stat = os.stat(target)
+                    directories.append((source_dir, target_dir))
+
+                    for entry in entries:
+                        target_child = os.path.join(target_dir, entry.name)
+                        if entry.is_dir():
+                            if entry.path == target or os.path.samestat(entry.stat(), target_root_stat):
+                                continue
+                            pending_directories.append((entry.path, target_child))
+                            continue
+                        entry_stat = entry.stat()
+                        if not stat.S_ISREG(entry_stat.st_mode):
+                            error = shutil.SpecialFileError(f"`{entry.path}` is not a regular file")
+                            errors.append((entry.path, target_child, str(error)))
+                            continue
+                        futures.append(executor.submit(self._copy_file_fast, entry.path, target_child, entry_stat))
+
+                for future in futures:
+                    future.result()
+
+            for source_dir, target_dir in reversed(directories):
+                shutil.copystat(source_dir, target_dir)
+        except BaseException:
+            if target_root_stat is not None:
+                shutil.rmtree(target, ignore_errors=True)
+            raise
+        if errors:
+            raise shutil.Error(errors)
 
     def copy(self, source: str | Path, destination: str | Path, overwrite: bool = False) -> Path:
-        source_path = self._to_path(source)
-        destination_path = self._to_path(destination)
+        source_path = self._to_path_fast(source)
+        destination_path = self._to_path_fast(destination)
 
-        if not source_path.exists():
+        source_stat = self._probe_target(source_path)
+        if source_stat is None:
             raise FileNotFoundError(
                 app_tr("FileOperations", "Quelle nicht gefunden: {path}").format(path=source_path)
             )
 
-        target_path = self._resolve_destination(source_path, destination_path)
+        target_path, target_stat = self._resolve_destination(source_path, destination_path)
+        return self._copy_to_target(source_path, source_stat, target_path, target_stat, overwrite)
+
+    def copy_many(
+        self,
+        pairs: list[tuple[str | Path, str | Path]],
+        overwrite: bool = False,
+        progress: Callable[[int], None] | None = None,
+    ) -> list[tuple[str | Path, Exception | None]]:
+        """Copy (source, destination) pairs; returns (source, error) pairs in input order.
+
+        Each destination is resolved the way copy() resolves it, but every
+        destination parent is created and scanned once for the whole batch
+        instead of probed once per item. progress(index), when given, is
+        called before each item is copied.
+        """
+        results: list[tuple[str | Path, Exception | None]] = [(source, None) for source, _destination in pairs]
+        scanned_parents: dict[Path, dict[str, os.stat_result]] = {}
+        for index, (source, destination) in enumerate(pairs):
+            if progress is not None:
+                progress(index)
+            try:
+                source_path = self._to_path_fast(source)
+                destination_path = self._to_path_fast(destination)
+                source_stat = self._probe_target(source_path)
+                if source_stat is None:
+                    raise FileNotFoundError(
+                        app_tr("FileOperations", "Quelle nicht gefunden: {path}").format(path=source_path)
+                    )
 
-        if target_path.exists():
+                parent = destination_path.parent
+                scanned = scanned_parents.get(parent)
+                if scanned is None:
+                    scanned = self._run_in_dir(parent, lambda: self.scan(parent))
+                    scanned_parents[parent] = scanned
+
+                target_path, target_stat = self._resolve_destination(source_path, destination_path, scanned)
+                self._copy_to_target(source_path, source_stat, target_path, target_stat, overwrite)
+                if target_path.parent == parent:
+                    # Two items with the same target must not both find it missing.
+                    scanned[target_path.name] = source_stat
+            except (OSError, ValueError) as error:
+                results[index] = (source, error)
+        return results
+
+    def _copy_to_target(
+        self,
+        source_path: Path,
+        source_stat: os.stat_result,
+        target_path: Path,
+        target_stat: os.stat_result | None,
+        overwrite: bool,
+    ) -> Path:
+        backup_dir = None
+        if target_stat is not None:
             if not overwrite:
                 raise FileExistsError(
                     app_tr("FileOperations", "Ziel existiert bereits: {path}").format(path=target_path)
                 )
-            self.delete(target_path, permanent=True)
+            # Park the old target next to it instead of removing it up front:
+            # the new copy does not wait for an rmtree, and the old data can
+            # be put back if the copy fails.
+            backup_dir = tempfile.mkdtemp(prefix=f".{target_path.name}.", suffix=".old", dir=target_path.parent)
+            backup_path = os.path.join(backup_dir, target_path.name)
+            os.rename(target_path, backup_path)
+
+        def copy_into_parent():
+            if stat.S_ISDIR(source_stat.st_mode):
+                self._copy_tree_parallel(str(source_path), str(target_path))
+            else:
+                self._copy_single_file(source_path, target_path, source_stat, overwrite)
+
+        try:
+            self._run_in_dir(target_path.parent, copy_into_parent)
+        except BaseException:
+            if backup_dir is not None:
+                self._discard_partial_copy(target_path)
+                os.rename(backup_path, target_path)
+                os.rmdir(backup_dir)
+            raise
+        finally:
+            self._invalidate_paths(target_path)
+
+        if backup_dir is not None:
+            shutil.rmtree(backup_dir, ignore_errors=True)
+        return target_path
 
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+    def _copy_single_file(
+        self,
+        source_path: Path,
+        target_path: Path,
+        source_stat: os.stat_result,
+        overwrite: bool,
+    ) -> None:
+        # The probe in copy() may be served from the stat cache; the O_EXCL
+        # create is the authoritative existence check and costs nothing extra.
+        try:
+            self._copy_file_fast(str(source_path), str(target_path), source_stat, exclusive=True)
+        except FileExistsError as error:
+            if not overwrite:
+                raise FileExistsError(
+                    app_tr("FileOperations", "Ziel existiert bereits: {path}").format(path=target_path)
+                ) from error
+            os.unlink(target_path)
+            self._copy_file_fast(str(source_path), str(target_path), source_stat, exclusive=True)
 
-        if source_path.is_dir():
-            shutil.copytree(source_path, target_path)
+    def _discard_partial_copy(self, target_path: Path) -> None:
+        if not os.path.lexists(target_path):
+            return
+        if os.path.isdir(target_path) and not os.path.islink(target_path):
+            shutil.rmtree(target_path, ignore_errors=True)
         else:
-            shutil.copy2(source_path, target_path)
-
-        return target_path
+            os.unlink(target_path)
 
     def move(self, source: str | Path, destination: str | Path, overwrite: bool = False) -> Path:
-        source_path = self._to_path(source)
-        destination_path = self._to_path(destination)
+        source_path = self._to_path_fast(source)
+        destination_path = self._to_path_fast(destination)
 
-        if not source_path.exists():
+        source_stat = self._probe_target(source_path)
+        if source_stat is None:
             raise FileNotFoundError(
                 app_tr("FileOperations", "Quelle nicht gefunden: {path}").format(path=source_path)
             )
 
-        target_path = self._resolve_destination(source_path, destination_path)
+        target_path, target_stat = self._resolve_destination(source_path, destination_path)
 
-        if target_path.exists():
+        if target_stat is not None:
             if not overwrite:
                 raise FileExistsError(
                     app_tr("FileOperations", "Ziel existiert bereits: {path}").format(path=target_path)
                 )
-            self.delete(target_path, permanent=True)
+            if not self._rename_replaces(source_stat, target_stat):
+                self._remove_path(target_path, target_stat)
 
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(source_path), str(target_path))
+        def move_into_parent():
+            try:
+                # On the same filesystem this is one atomic rename, however big the tree.
+                os.rename(source_path, target_path)
+            except OSError as error:
+                if error.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(source_path), str(target_path))
+
+        try:
+            self._run_in_dir(target_path.parent, move_into_parent)
+        finally:
+            self._invalidate_paths(source_path, target_path)
         return target_path
 
     def delete(self, target: str | Path, permanent: bool = False) -> None:
-        target_path = self._to_path(target)
+        target_path = self._to_path_fast(target)
 
-        if not target_path.exists():
+        target_stat = self._probe_target(target_path)
+        if target_stat is None:
             raise FileNotFoundError(
                 app_tr("FileOperations", "Pfad nicht gefunden: {path}").format(path=target_path)
             )
 
         if not permanent:
+            send2trash_module = self._get_send2trash()
             try:
-                send2trash_module = importlib.import_module("send2trash")
-            except ModuleNotFoundError as error:
-                raise RuntimeError(
-                    app_tr("FileOperations", "Papierkorb-Funktion ist nicht verfügbar (send2trash fehlt).")
-                ) from error
-
-            send2trash_module.send2trash(str(target_path))
+                send2trash_module.send2trash(str(target_path))
+            finally:
+                self._invalidate_paths(target_path)
             return
 
-        if target_path.is_dir():
-            shutil.rmtree(target_path)
+        self._remove_path(target_path, target_stat)
+
+    def _rename_replaces(self, source_stat: os.stat_result, target_stat: os.stat_result) -> bool:
+        # rename() atomically replaces an existing non-directory target with a
+        # non-directory source; the old inode is released by the kernel. Any
+        # directory on either side still needs the target removed first.
+        return not stat.S_ISDIR(source_stat.st_mode) and not stat.S_ISDIR(target_stat.st_mode)
+
+    def delete_many(self, targets: list[str | Path], permanent: bool = False) -> list[tuple[str | Path, Exception | None]]:
+        """Delete several paths; returns (target, error) pairs in input order.
+
+        Permanent deletes are grouped by parent directory and removed relative
+        to one open directory descriptor per parent.
+        """
+        results: list[tuple[str | Path, Exception | None]] = [(target, None) for target in targets]
+        if not permanent:
+            for index, target in enumerate(targets):
+                try:
+                    self.delete(target, permanent=False)
+                except (RuntimeError, OSError, ValueError) as error:
+                    results[index] = (target, error)
+            return results
+
+        by_parent: dict[str, list[tuple[int, str]]] = {}
+        for index, target in enumerate(targets):
+            target_str = os.path.abspath(os.path.expanduser(os.fspath(target)))
+            parent, name = os.path.split(target_str)
+            by_parent.setdefault(parent, []).append((index, name))
+
+        for parent, entries in by_parent.items():
+            try:
+                parent_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError as error:
+                for index, _name in entries:
+                    results[index] = (targets[index], error)
+                continue
+
+            try:
+                for index, name in entries:
+                    try:
+                        self._remove_entry_at(parent_fd, parent, name)
+                    except (OSError, ValueError) as error:
+                        results[index] = (targets[index], error)
+            finally:
+                os.close(parent_fd)
+                self._invalidate_paths(*(os.path.join(parent, name) for _index, name in entries))
+        return results
+
+    def _remove_entry_at(self, parent_fd: int, parent: str, name: str) -> None:
+        try:
+            entry_stat = os.stat(name, dir_fd=parent_fd, follow_symlinks=False)
+        except FileNotFoundError as error:
+            raise FileNotFoundError(
+                app_tr("FileOperations", "Pfad nicht gefunden: {path}").format(path=os.path.join(parent, name))
+            ) from error
+
+        if stat.S_ISDIR(entry_stat.st_mode):
+            if _RMTREE_AT_SUPPORTED:
+                self._rmtree_at(parent_fd, name)
+            else:
+                shutil.rmtree(os.path.join(parent, name))
         else:
-            target_path.unlink()
+            os.unlink(name, dir_fd=parent_fd)
+
+    def _rmtree_at(self, parent_fd: int, name: str) -> None:
+        # Like shutil.rmtree()'s fd-based variant, minus its per-entry lstat():
+        # DirEntry.is_dir(follow_symlinks=False) comes from getdents' d_type.
+        # O_NOFOLLOW keeps a directory swapped for a symlink from being entered.
+        dir_fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=parent_fd)
+        try:
+            with os.scandir(dir_fd) as iterator:
+                entries = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in iterator]
+            for entry_name, entry_is_dir in entries:
+                if entry_is_dir:
+                    self._rmtree_at(dir_fd, entry_name)
+                else:
+                    os.unlink(entry_name, dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+        os.rmdir(name, dir_fd=parent_fd)
+
+    def _rmtree_fast(self, path: str | Path) -> None:
+        if not _RMTREE_AT_SUPPORTED:
+            shutil.rmtree(path)
+            return
+        parent, name = os.path.split(os.fspath(path))
+        parent_fd = os.open(parent or os.curdir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            self._rmtree_at(parent_fd, name)
+        finally:
+            os.close(parent_fd)
+
+    def _remove_path(self, target_path: str | Path, target_stat: os.stat_result) -> None:
+        """Permanently remove target_path, whose stat() result is already known."""
+        try:
+            # A symlink to a directory is removed as a link; never recurse
+            # into whatever it points to.
+            if stat.S_ISDIR(target_stat.st_mode) and not os.path.islink(target_path):
+                self._rmtree_fast(target_path)
+            else:
+                os.unlink(target_path)
+        finally:
+            self._invalidate_paths(target_path)
 
     def rename(self, target: str | Path, new_name: str, overwrite: bool = False) -> Path:
-        target_path = self._to_path(target)
+        # Bulk renames go through here once per item; stay on plain strings and
+        # only build a Path for the return value.
+        target_str = os.path.abspath(os.path.expanduser(os.fspath(target)))
 
-        if not target_path.exists():
+        target_stat = self._probe_target(target_str)
+        if target_stat is None:
             raise FileNotFoundError(
-                app_tr("FileOperations", "Pfad nicht gefunden: {path}").format(path=target_path)
+                app_tr("FileOperations", "Pfad nicht gefunden: {path}").format(path=target_str)
             )
 
         if not new_name or new_name.strip() == "":
@@ -141,17 +752,22 @@ class FileOperations:
         if "/" in new_name or "\\" in new_name:
             raise ValueError(app_tr("FileOperations", "new_name darf keinen Pfad enthalten"))
 
-        destination_path = target_path.with_name(new_name)
+        destination_str = os.path.join(os.path.dirname(target_str), new_name)
 
-        if destination_path.exists():
+        destination_stat = self._probe_target(destination_str)
+        if destination_stat is not None:
             if not overwrite:
                 raise FileExistsError(
-                    app_tr("FileOperations", "Ziel existiert bereits: {path}").format(path=destination_path)
+                    app_tr("FileOperations", "Ziel existiert bereits: {path}").format(path=destination_str)
                 )
-            self.delete(destination_path, permanent=True)
+            if not self._rename_replaces(target_stat, destination_stat):
+                self._remove_path(destination_str, destination_stat)
 
-        target_path.rename(destination_path)
-        return destination_path
+        try:
+            os.rename(target_str, destination_str)
+        finally:
+            self._invalidate_paths(target_str, destination_str)
+        return Path(destination_str)
 
     def create_archive(self, sources: list[str | Path], archive: str | Path, overwrite: bool = False) -> Path:
         source_paths = [self._to_path(source) for source in sources]
@@ -260,7 +876,7 @@ class FileOperations:
                 if info.is_dir():
                     target_path.mkdir(parents=True, exist_ok=True)
                     continue
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(target_path.parent)
                 with archive.open(info) as source_handle, target_path.open("wb") as target_handle:
                     shutil.copyfileobj(source_handle, target_handle)
 
@@ -296,7 +912,7 @@ class FileOperations:
                 extracted = archive.extractfile(member)
                 if extracted is None:
                     continue
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(target_path.parent)
                 with extracted, target_path.open("wb") as target_handle:
                     shutil.copyfileobj(extracted, target_handle)
 
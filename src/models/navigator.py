@@ -1,14 +1,16 @@
-import copy
-import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QModelIndex, QStandardPaths, QEvent, QObject, QSize, Signal, QRect
+from PySide6.QtCore import Qt, QModelIndex, QStandardPaths, QEvent, QObject, QSize, Signal, QRect, QTimer
 from PySide6.QtGui import QColor, QIcon, QPen
 from PySide6.QtWidgets import QApplication, QAbstractItemView, QHeaderView, QStyle, QStyledItemDelegate, QTreeWidget, QTreeWidgetItem, QMenu, QInputDialog, QLineEdit, QWidgetAction, QCheckBox
 
 from localization import app_tr
 from domain.filesystem import PaneLocation
+from utils.json_io import dumps_json_bytes, loads_json_bytes, write_bytes_atomic
 
 
 ROLE_PATH = Qt.ItemDataRole.UserRole
@@ -24,6 +26,99 @@ ROLE_ENTRY_SOURCE = Qt.ItemDataRole.UserRole + 9
 ROLE_LOCATION_KIND = Qt.ItemDataRole.UserRole + 10
 ROLE_REMOTE_ID = Qt.ItemDataRole.UserRole + 11
 
+# Viewport events NavigatorManager.eventFilter acts on; everything else
+# (mouse moves, paints, ...) is passed through untouched.
+_VIEWPORT_FILTER_EVENT_TYPES = frozenset(
+    (
+        QEvent.Type.MouseButtonRelease,
+        QEvent.Type.DragEnter,
+        QEvent.Type.DragMove,
+        QEvent.Type.DragLeave,
+        QEvent.Type.Drop,
+        QEvent.Type.ThemeChange,
+    )
+)
+
+# Dropped folders are checked concurrently so one slow network mount does not
+# stall the others; created on first multi-folder drop.
+_STAT_POOL_WORKERS = 8
+_stat_pool = None
+
+
+def _get_stat_pool():
+    global _stat_pool
+    if _stat_pool is None:
+        _stat_pool = ThreadPoolExecutor(max_workers=_STAT_POOL_WORKERS, thread_name_prefix="navigator-stat")
+    return _stat_pool
+
+# $HOME does not change while the app runs, and entry paths repeat on every rebuild.
+_expanduser = lru_cache(maxsize=256)(os.path.expanduser)
+
+# Item flags derived once from QTreeWidgetItem's defaults (selectable,
+# user-checkable, enabled, drag- and drop-enabled) instead of per item.
+_DEFAULT_TREE_ITEM_FLAGS = (
+    Qt.ItemFlag.ItemIsSelectable
+    | Qt.ItemFlag.ItemIsUserCheckable
+    | Qt.ItemFlag.ItemIsEnabled
+    | Qt.ItemFlag.ItemIsDragEnabled
+    | Qt.ItemFlag.ItemIsDropEnabled
+)
+_ENTRY_ITEM_FLAGS = _DEFAULT_TREE_ITEM_FLAGS & ~Qt.ItemFlag.ItemIsDropEnabled
+_GROUP_ITEM_FLAGS = _DEFAULT_TREE_ITEM_FLAGS & ~(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled)
+
+# Dynamic Places tokens: (QStandardPaths location or None, fallback path, default icon).
+_DYNAMIC_ENTRY_LOCATIONS = {
+    'home': (None, '~', 'user-home'),
+    'trash': (None, '~/.local/share/Trash/files', 'user-trash'),
+    'desktop': (QStandardPaths.StandardLocation.DesktopLocation, '~/Desktop', 'user-desktop'),
+    'documents': (QStandardPaths.StandardLocation.DocumentsLocation, '~/Documents', 'folder-documents'),
+    'downloads': (QStandardPaths.StandardLocation.DownloadLocation, '~/Downloads', 'folder-download'),
+}
+
+
+@lru_cache(maxsize=None)
+def _dynamic_entry_path(dynamic_token):
+    standard_location, fallback_path, _icon = _DYNAMIC_ENTRY_LOCATIONS[dynamic_token]
+    if standard_location is not None:
+        path = QStandardPaths.writableLocation(standard_location)
+        if path:
+            return path
+    return _expanduser(fallback_path)
+
+
+_DRIVE_ICON = 'drive-harddisk'
+_ROOT_LABEL = 'Root'
+
+# Directories whose subdirectories are listed as drives; /run/media holds
+# one directory per user with the mounts one level below.
+_DRIVE_BASE_DIRS = ('/mnt', '/media')
+_RUN_MEDIA_DIR = '/run/media'
+
+
+def _drive_listing_signature():
+    """mtimes of every directory the drive listing is read from.
+
+    Creating or removing a mount point changes the parent's mtime, so an
+    unchanged signature means the listing is unchanged.
+    """
+    signature = []
+    for base in (*_DRIVE_BASE_DIRS, _RUN_MEDIA_DIR):
+        try:
+            signature.append((base, os.stat(base).st_mtime_ns))
+        except OSError:
+            continue
+    try:
+        with os.scandir(_RUN_MEDIA_DIR) as user_dirs:
+            for user_dir in user_dirs:
+                try:
+                    if user_dir.is_dir():
+                        signature.append((user_dir.path, user_dir.stat().st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return tuple(sorted(signature))
+
 
 DEFAULT_NAVIGATOR_DATA = {
     "groups": [
@@ -60,6 +155,20 @@ DEFAULT_NAVIGATOR_DATA = {
     ]
 }
 
+# Fresh copies of the defaults are parsed from this snapshot, which is
+# considerably cheaper than deep-copying the nested structure.
+_DEFAULT_NAVIGATOR_JSON = dumps_json_bytes(DEFAULT_NAVIGATOR_DATA)
+
+
+def default_navigator_data():
+    return loads_json_bytes(_DEFAULT_NAVIGATOR_JSON)
+
+
+def _clone_entry(entry):
+    # Entries are flat dicts of primitives; copying list values as well is
+    # all a deepcopy would add here.
+    return {key: (value[:] if isinstance(value, list) else value) for key, value in entry.items()}
+
 
 class NavigatorDropIndicatorDelegate(QStyledItemDelegate):
     def __init__(self, manager, parent=None):
@@ -69,15 +178,15 @@ class NavigatorDropIndicatorDelegate(QStyledItemDelegate):
     def paint(self, painter, option, index):
         super().paint(painter, option, index)
 
-        current_item = self.manager.widget.itemFromIndex(index)
-        if current_item is not None:
-            self.manager.paint_group_action_icon(painter, option, current_item)
+        manager = self.manager
+        # Only group rows can carry an action icon, so resolve the item for those alone.
+        if index.data(ROLE_KIND) == 'group':
+            manager.paint_group_action_icon(painter, option, manager.widget.itemFromIndex(index))
 
-        indicator_item = self.manager._drop_indicator_item
-        if indicator_item is None:
+        indicator_position = manager._drop_indicator_position
+        if indicator_position is None:
             return
-
-        if current_item is not indicator_item:
+        if index.row() != indicator_position[0] or index.parent().row() != indicator_position[1]:
             return
 
         rect = option.rect
@@ -100,10 +209,74 @@ class NavigatorManager(QObject):
         self.data_path = data_path
         self.remote_mount_settings = remote_mount_settings
         self.remote_connection_settings = remote_connection_settings
+        self._group_index = {}
+        self._entry_key_index = {}
         self.loaded_data = {"groups": []}
         self.allowed_drop_groups = {"Places", "Cloud"}
         self._drop_indicator_item = None
         self._drop_indicator_draw_bottom = False
+        # (row, parent row) of _drop_indicator_item, compared by the delegate
+        # for every painted cell; the parent row is -1 for top-level items.
+        self._drop_indicator_position = None
+        # Local directories carried by the drag in progress; computed on
+        # DragEnter and reused for every DragMove and the final Drop.
+        self._drag_paths = None
+        self._viewport = widget.viewport()
+        # Cleared when the tree widget goes away, so late viewport events
+        # during teardown never touch deleted items.
+        self._alive = True
+        widget.destroyed.connect(self._on_widget_destroyed)
+        self._items_by_key = {}
+        self._icon_cache = {}
+        self._drive_entries_cache = None
+        self._drive_entries_signature = None
+        # Resolved dynamic entries, keyed by (token, label, icon); the dicts
+        # are shared across rebuilds and must not be mutated.
+        self._dynamic_entry_cache = {}
+        # Writes of navigator.json are coalesced; loaded_data is always
+        # current, the timer only delays putting it on disk.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(150)
+        self._save_timer.timeout.connect(self._write_pending_state)
+
+    @property
+    def loaded_data(self):
+        return self._loaded_data
+
+    @loaded_data.setter
+    def loaded_data(self, data):
+        self._loaded_data = data
+        self._rebuild_data_index()
+
+    def _rebuild_data_index(self):
+        """Index loaded_data by normalized group name and by system entry key.
+
+        Must be called again whenever a group's entry list is replaced in place.
+        """
+        group_index = {}
+        entry_key_index = {}
+        groups = self._loaded_data.get('groups', []) if isinstance(self._loaded_data, dict) else []
+        for group in groups:
+            if not isinstance(group, dict):
+                continue
+            group_name = self._normalize_group_name(group.get('name', ''))
+            if group_name in group_index:
+                continue
+            group_index[group_name] = group
+
+            entries = group.get('entries', [])
+            if not isinstance(entries, list):
+                continue
+            for idx, entry in enumerate(entries):
+                if not isinstance(entry, dict):
+                    continue
+                if str(entry.get('source', 'system')).strip() != 'system':
+                    continue
+                entry_key_index.setdefault((group_name, self.build_entry_key(entry, idx)), entry)
+
+        self._group_index = group_index
+        self._entry_key_index = entry_key_index
 
     def _normalize_group_name(self, name: str) -> str:
         text = str(name or "").strip().lower()
@@ -156,68 +329,96 @@ class NavigatorManager(QObject):
         self.loaded_data = self.load_data()
         self.build_from_data(self.loaded_data)
         self.widget.itemCollapsed.connect(self.on_item_collapsed)
+        self.widget.itemExpanded.connect(self.on_item_expanded)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_pending_save)
 
     def eventFilter(self, watched, event):
-        try:
-            if watched == self.widget.viewport():
-                if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
-                    if self.handle_group_action_click(event.position().toPoint()):
-                        return True
-
-                if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.MiddleButton:
-                    item = self.widget.itemAt(event.position().toPoint())
-                    location = self.get_entry_location(item) if item is not None else None
-                    if location is not None:
-                        self.entryMiddleClicked.emit(location)
-                        return True
-
-                if event.type() == QEvent.Type.DragEnter:
-                    if self.can_handle_internal_custom_drop(event):
-                        self.update_drop_indicator(event.position().toPoint())
-                        event.acceptProposedAction()
-                        return True
-                    if self.can_handle_external_folder_drop(event):
-                        self.update_drop_indicator(event.position().toPoint())
-                        event.acceptProposedAction()
-                        return True
-
-                if event.type() == QEvent.Type.DragMove:
-                    if self.can_handle_internal_custom_drop(event):
-                        self.update_drop_indicator(event.position().toPoint())
-                        event.acceptProposedAction()
-                        return True
-                    if self.can_handle_external_folder_drop(event):
-                        self.update_drop_indicator(event.position().toPoint())
-                        event.acceptProposedAction()
-                        return True
-                    self.clear_drop_indicator()
-
-                if event.type() == QEvent.Type.DragLeave:
-                    self.clear_drop_indicator()
-                    return False
-
-                if event.type() == QEvent.Type.Drop:
-                    try:
-                        if self.handle_internal_custom_drop(event):
-                            return True
-                        if self.handle_external_folder_drop(event):
-                            return True
-                    finally:
-                        self.clear_drop_indicator()
-                    return False
-
-            return super().eventFilter(watched, event)
-        except RuntimeError:
+        if not self._alive or watched is not self._viewport:
+            return False
+        event_type = event.type()
+        if event_type not in _VIEWPORT_FILTER_EVENT_TYPES:
+            return False
+
+        if event_type == QEvent.Type.ThemeChange:
+            self._icon_cache.clear()
+            return False
+
+        if event_type == QEvent.Type.MouseButtonRelease:
+            button = event.button()
+            if button == Qt.MouseButton.LeftButton:
+                if self.handle_group_action_click(event.position().toPoint()):
+                    return True
+            elif button == Qt.MouseButton.MiddleButton:
+                item = self.widget.itemAt(event.position().toPoint())
+                location = self.get_entry_location(item) if item is not None else None
+                if location is not None:
+                    self.entryMiddleClicked.emit(location)
+                    return True
             return False
 
+        if event_type == QEvent.Type.DragEnter:
+            self._drag_paths = None
+            self._drag_paths = self.extract_local_directory_paths(event)
+            if self.can_handle_internal_custom_drop(event):
+                self.update_drop_indicator(event.position().toPoint())
+                event.acceptProposedAction()
+                return True
+            if self.can_handle_external_folder_drop(event):
+                self.update_drop_indicator(event.position().toPoint())
+                event.acceptProposedAction()
+                return True
+        elif event_type == QEvent.Type.DragMove:
+            if self.can_handle_internal_custom_drop(event):
+                self.update_drop_indicator(event.position().toPoint())
+                event.acceptProposedAction()
+                return True
+            if self.can_handle_external_folder_drop(event):
+                self.update_drop_indicator(event.position().toPoint())
+                event.acceptProposedAction()
+                return True
+            self.clear_drop_indicator()
+        elif event_type == QEvent.Type.DragLeave:
+            self._drag_paths = None
+            self.clear_drop_indicator()
+        else:
+            try:
+                if self.handle_internal_custom_drop(event):
+                    return True
+                if self.handle_external_folder_drop(event):
+                    return True
+            finally:
+                self._drag_paths = None
+                self.clear_drop_indicator()
+        return False
+
+    def _on_widget_destroyed(self, *_args):
+        self._alive = False
+        self._drag_paths = None
+        self._drop_indicator_item = None
+        self._drop_indicator_position = None
+
+    def _item_position(self, item):
+        parent = item.parent()
+        if parent is None:
+            return self.widget.indexOfTopLevelItem(item), -1
+        return parent.indexOfChild(item), self.widget.indexOfTopLevelItem(parent)
+
+    def _drop_indicator_rect(self, item):
+        # The indicator is a 2px line on the top or bottom edge of the item row.
+        return self.widget.visualItemRect(item).adjusted(0, -2, 0, 2)
+
     def clear_drop_indicator(self):
-        if self._drop_indicator_item is None:
+        previous_item = self._drop_indicator_item
+        if previous_item is None:
             return
 
         self._drop_indicator_item = None
         self._drop_indicator_draw_bottom = False
+        self._drop_indicator_position = None
         try:
-            self.widget.viewport().update()
+            self._viewport.update(self._drop_indicator_rect(previous_item))
         except RuntimeError:
             return
 
@@ -243,12 +444,22 @@ class NavigatorManager(QObject):
         if indicator_item is self._drop_indicator_item and draw_bottom == self._drop_indicator_draw_bottom:
             return
 
+        dirty_rect = self._drop_indicator_rect(indicator_item)
+        if self._drop_indicator_item is not None:
+            dirty_rect = dirty_rect.united(self._drop_indicator_rect(self._drop_indicator_item))
+
         self._drop_indicator_item = indicator_item
         self._drop_indicator_draw_bottom = draw_bottom
-        self.widget.viewport().update()
+        self._drop_indicator_position = self._item_position(indicator_item)
+        self._viewport.update(dirty_rect)
 
     def resolve_drop_target_position(self, pos):
-        target_item = self.widget.itemAt(pos)
+        # Resolve the index once and derive item, row and rect from it; this
+        # runs for every DragMove.
+        index = self.widget.indexAt(pos)
+        if not index.isValid():
+            return None, 0
+        target_item = self.widget.itemFromIndex(index)
         if target_item is None:
             return None, 0
 
@@ -261,8 +472,8 @@ class NavigatorManager(QObject):
             if group_item is None:
                 return None, 0
 
-            row = group_item.indexOfChild(target_item)
-            rect = self.widget.visualItemRect(target_item)
+            row = index.row()
+            rect = self.widget.visualRect(index)
             insert_row = row if pos.y() < rect.center().y() else row + 1
         else:
             return None, 0
@@ -342,7 +553,6 @@ class NavigatorManager(QObject):
             return True
 
         group_name = self._normalize_group_name(target_group.data(0, ROLE_GROUP_NAME) or target_group.text(0) or '')
-        self.loaded_data = self.load_data()
         self.widget.clear()
         self.build_from_data(self.loaded_data)
         self._expand_group_by_name(group_name)
@@ -366,7 +576,6 @@ class NavigatorManager(QObject):
         group_name = self._normalize_group_name(target_group.data(0, ROLE_GROUP_NAME) or target_group.text(0) or '')
         target_group.setExpanded(True)
         self.save_current_state()
-        self.loaded_data = self.load_data()
         self.widget.clear()
         self.build_from_data(self.loaded_data)
         if group_name:
@@ -422,8 +631,7 @@ class NavigatorManager(QObject):
 
     def _reorder_custom_entries_in_group(self, group_item, dragged_paths, custom_insert_index):
         group_name = self._normalize_group_name(group_item.data(0, ROLE_GROUP_NAME) or group_item.text(0) or '')
-        groups = self.loaded_data.get('groups', []) if isinstance(self.loaded_data, dict) else []
-        target_group = next((group for group in groups if self._normalize_group_name(group.get('name', '')) == group_name), None)
+        target_group = self._group_index.get(group_name)
         if not isinstance(target_group, dict):
             return False
 
@@ -437,9 +645,9 @@ class NavigatorManager(QObject):
             if not isinstance(entry, dict):
                 continue
             if str(entry.get('source', 'system')).strip() == 'custom':
-                custom_entries.append(copy.deepcopy(entry))
+                custom_entries.append(_clone_entry(entry))
             else:
-                system_entries.append(copy.deepcopy(entry))
+                system_entries.append(_clone_entry(entry))
 
         moving_entries = []
         remaining_entries = []
@@ -458,43 +666,52 @@ class NavigatorManager(QObject):
         reordered_custom_entries = list(remaining_entries)
         reordered_custom_entries[insert_index:insert_index] = moving_entries
         target_group['entries'] = system_entries + reordered_custom_entries
-        self.save_data(self.loaded_data)
+        self._rebuild_data_index()
+        self._save_timer.start()
         return True
 
-    def _expand_group_by_name(self, group_name):
+    def _group_item_by_name(self, group_name):
         if not group_name:
-            return
+            return None
         for top_index in range(self.widget.topLevelItemCount()):
             candidate = self.widget.topLevelItem(top_index)
+            if candidate.data(0, ROLE_KIND) != 'group':
+                continue
             candidate_name = self._normalize_group_name(candidate.data(0, ROLE_GROUP_NAME) or candidate.text(0) or '')
             if candidate_name == group_name:
-                candidate.setExpanded(True)
-                return
+                return candidate
+        return None
+
+    def _expand_group_by_name(self, group_name):
+        group_item = self._group_item_by_name(group_name)
+        if group_item is not None:
+            group_item.setExpanded(True)
 
     def extract_local_directory_paths(self, event):
+        if self._drag_paths is not None:
+            return self._drag_paths
+
         mime_data = event.mimeData()
         if mime_data is None or not mime_data.hasUrls():
             return []
 
         seen = set()
-        directories = []
+        candidates = []
         for url in mime_data.urls():
             if not url.isLocalFile():
                 continue
 
             local_path = os.path.normpath(os.path.expanduser(url.toLocalFile()))
-            try:
-                if not os.path.isdir(local_path):
-                    continue
-            except (OSError, PermissionError):
-                continue
             if local_path in seen:
                 continue
-
             seen.add(local_path)
-            directories.append(local_path)
+            candidates.append(local_path)
 
-        return directories
+        if len(candidates) > 1:
+            is_directory = list(_get_stat_pool().map(os.path.isdir, candidates))
+        else:
+            is_directory = [os.path.isdir(path) for path in candidates]
+        return [path for path, is_dir in zip(candidates, is_directory) if is_dir]
 
     def insert_paths_into_group(self, group_item, paths, insert_row=None):
         existing_paths = set()
@@ -506,8 +723,9 @@ class NavigatorManager(QObject):
             if entry_path:
                 existing_paths.add(os.path.normpath(str(entry_path)))
 
-        inserted = False
-        row_cursor = group_item.childCount() if insert_row is None else max(0, min(int(insert_row), group_item.childCount()))
+        row = group_item.childCount() if insert_row is None else max(0, min(int(insert_row), group_item.childCount()))
+        entry_icon = self.resolve_icon('folder', QStyle.StandardPixmap.SP_DirIcon)
+        new_items = []
         for path in paths:
             normalized_path = os.path.normpath(path)
             if normalized_path in existing_paths:
@@ -523,21 +741,19 @@ class NavigatorManager(QObject):
             item.setData(0, ROLE_ENTRY_KEY, f'entry:drop:{normalized_path}')
             item.setData(0, ROLE_ENTRY_SOURCE, 'custom')
 
-            flags = item.flags()
-            flags |= Qt.ItemFlag.ItemIsDragEnabled
-            flags &= ~Qt.ItemFlag.ItemIsDropEnabled
-            item.setFlags(flags)
+            item.setFlags(_ENTRY_ITEM_FLAGS)
 
-            entry_icon = self.resolve_icon('folder', QStyle.StandardPixmap.SP_DirIcon)
             if not entry_icon.isNull():
                 item.setIcon(0, entry_icon)
 
-            group_item.insertChild(row_cursor, item)
+            new_items.append(item)
             existing_paths.add(normalized_path)
-            inserted = True
-            row_cursor += 1
 
-        return inserted
+        if not new_items:
+            return False
+        # One rowsInserted for the whole drop instead of one per folder.
+        group_item.insertChildren(row, new_items)
+        return True
 
 
     def load_data(self):
@@ -546,7 +762,7 @@ class NavigatorManager(QObject):
                 self.data_path.parent.mkdir(parents=True, exist_ok=True)
             except (OSError, PermissionError):
                 pass
-            default_data = copy.deepcopy(DEFAULT_NAVIGATOR_DATA)
+            default_data = default_navigator_data()
             try:
                 self.save_data(default_data)
             except Exception:
@@ -554,14 +770,13 @@ class NavigatorManager(QObject):
             return default_data
 
         try:
-            with self.data_path.open('r', encoding='utf-8') as file:
-                data = json.load(file)
-        except (json.JSONDecodeError, OSError, PermissionError):
-            data = copy.deepcopy(DEFAULT_NAVIGATOR_DATA)
+            data = loads_json_bytes(self.data_path.read_bytes())
+        except (ValueError, OSError):
+            data = default_navigator_data()
 
         groups = data.get('groups') if isinstance(data, dict) else None
         if not isinstance(groups, list):
-            data = copy.deepcopy(DEFAULT_NAVIGATOR_DATA)
+            data = default_navigator_data()
 
         return data
 
@@ -572,12 +787,12 @@ class NavigatorManager(QObject):
         except (OSError, PermissionError):
             return
         try:
-            with self.data_path.open('w', encoding='utf-8') as file:
-                json.dump(data, file, ensure_ascii=False, indent=2)
+            write_bytes_atomic(self.data_path, dumps_json_bytes(data))
         except (OSError, PermissionError):
             pass
 
     def build_from_data(self, data):
+        self._items_by_key = {}
         rendered_groups = 0
         for group in data.get('groups', []):
             is_active = group.get('active', True)
@@ -600,11 +815,7 @@ class NavigatorManager(QObject):
             group_item.setData(0, ROLE_ICON, group.get('icon', ''))
             group_item.setData(0, ROLE_COLLAPSIBLE, bool(group.get('collapsible', True)))
             group_item.setData(0, ROLE_DYNAMIC, group.get('dynamic', ''))
-            group_flags = group_item.flags()
-            group_flags &= ~Qt.ItemFlag.ItemIsSelectable
-            group_flags &= ~Qt.ItemFlag.ItemIsDragEnabled
-            group_flags |= Qt.ItemFlag.ItemIsDropEnabled
-            group_item.setFlags(group_flags)
+            group_item.setFlags(_GROUP_ITEM_FLAGS)
 
             group_font = group_item.font(0)
             group_font.setBold(True)
@@ -627,6 +838,14 @@ class NavigatorManager(QObject):
                 entries = list(entries) if isinstance(entries, list) else []
                 entries.extend(self._remote_entries())
 
+            # Keys are taken from the unfiltered entry list so they match the
+            # keys the activation helpers compute for the same group.
+            entry_keys = {}
+            if isinstance(entries, list):
+                for entry_index, entry in enumerate(entries):
+                    if isinstance(entry, dict):
+                        entry_keys[id(entry)] = self.build_entry_key(entry, entry_index)
+
             if canonical_group_name == 'Places' and isinstance(entries, list):
                 system_entries = []
                 custom_entries = []
@@ -651,57 +870,32 @@ class NavigatorManager(QObject):
 
             for entry_index, entry in enumerate(entries):
                 entry_type = entry.get('type', 'entry')
-                entry_key = self.build_entry_key(entry, entry_index)
+                entry_key = entry_keys.get(id(entry))
 
                 if entry_type == 'separator':
+                    is_source_entry = entry_key is not None
+                    if not is_source_entry:
+                        # Synthesized Places separator, not part of the stored entries.
+                        entry_key = self.build_entry_key(entry, entry_index)
                     separator_label = entry.get('label', '────────────')
                     separator_item = QTreeWidgetItem([separator_label])
                     separator_item.setData(0, ROLE_KIND, 'separator')
                     separator_item.setData(0, ROLE_ENTRY_TYPE, 'separator')
                     separator_item.setData(0, ROLE_ENTRY_KEY, entry_key)
                     separator_item.setFlags(Qt.ItemFlag.NoItemFlags)
+                    if is_source_entry:
+                        self._items_by_key[(canonical_group_name, entry_key)] = separator_item
                     group_item.addChild(separator_item)
                     continue
 
                 if not entry.get('active', True):
                     continue
 
-                resolved_entry = self.resolve_entry_data(entry)
-                if not resolved_entry:
+                entry_item = self._create_entry_item(entry)
+                if entry_item is None:
                     continue
 
-                raw_label = resolved_entry.get('label', '')
-                dynamic_token = resolved_entry.get('dynamic', '')
-                source = str(resolved_entry.get('source', 'system')).strip()
-                if source == 'system':
-                    effective_label = self._canonical_system_label(dynamic_token, raw_label)
-                    label = app_tr('NavigatorManager', effective_label)
-                else:
-                    effective_label = str(raw_label or '').strip()
-                    label = effective_label
-                path = os.path.expanduser(resolved_entry.get('path', ''))
-                entry_item = QTreeWidgetItem([label])
-                entry_item.setData(0, ROLE_ENTRY_KEY, effective_label)
-                entry_item.setData(0, ROLE_KIND, 'entry')
-                entry_item.setData(0, ROLE_PATH, path)
-                entry_item.setData(0, ROLE_ICON, resolved_entry.get('icon', ''))
-                entry_item.setData(0, ROLE_ENTRY_TYPE, 'entry')
-                entry_item.setData(0, ROLE_ENTRY_DYNAMIC, resolved_entry.get('dynamic', ''))
-                entry_item.setData(0, ROLE_ENTRY_SOURCE, resolved_entry.get('source', 'system'))
-                entry_item.setData(0, ROLE_LOCATION_KIND, resolved_entry.get('location_kind', 'local'))
-                entry_item.setData(0, ROLE_REMOTE_ID, resolved_entry.get('remote_id', ''))
-                tooltip = str(resolved_entry.get('tooltip') or '').strip()
-                if tooltip:
-                    entry_item.setToolTip(0, tooltip)
-                entry_flags = entry_item.flags()
-                entry_flags |= Qt.ItemFlag.ItemIsDragEnabled
-                entry_flags &= ~Qt.ItemFlag.ItemIsDropEnabled
-                entry_item.setFlags(entry_flags)
-
-                entry_icon = self.resolve_icon(resolved_entry.get('icon'), QStyle.StandardPixmap.SP_FileIcon)
-                if not entry_icon.isNull():
-                    entry_item.setIcon(0, entry_icon)
-
+                self._items_by_key[(canonical_group_name, entry_key)] = entry_item
                 group_item.addChild(entry_item)
 
             collapsible = bool(group.get('collapsible', True))
@@ -711,6 +905,41 @@ class NavigatorManager(QObject):
             group_item.setExpanded(group.get('expanded', True) if collapsible else True)
             rendered_groups += 1
 
+    def _create_entry_item(self, entry):
+        resolved_entry = self.resolve_entry_data(entry)
+        if not resolved_entry:
+            return None
+
+        raw_label = resolved_entry.get('label', '')
+        dynamic_token = resolved_entry.get('dynamic', '')
+        source = str(resolved_entry.get('source', 'system')).strip()
+        if source == 'system':
+            effective_label = self._canonical_system_label(dynamic_token, raw_label)
+            label = app_tr('NavigatorManager', effective_label)
+        else:
+            effective_label = str(raw_label or '').strip()
+            label = effective_label
+        path = _expanduser(resolved_entry.get('path', ''))
+        entry_item = QTreeWidgetItem([label])
+        entry_item.setData(0, ROLE_ENTRY_KEY, effective_label)
+        entry_item.setData(0, ROLE_KIND, 'entry')
+        entry_item.setData(0, ROLE_PATH, path)
+        entry_item.setData(0, ROLE_ICON, resolved_entry.get('icon', ''))
+        entry_item.setData(0, ROLE_ENTRY_TYPE, 'entry')
+        entry_item.setData(0, ROLE_ENTRY_DYNAMIC, resolved_entry.get('dynamic', ''))
+        entry_item.setData(0, ROLE_ENTRY_SOURCE, resolved_entry.get('source', 'system'))
+        entry_item.setData(0, ROLE_LOCATION_KIND, resolved_entry.get('location_kind', 'local'))
+        entry_item.setData(0, ROLE_REMOTE_ID, resolved_entry.get('remote_id', ''))
+        tooltip = str(resolved_entry.get('tooltip') or '').strip()
+        if tooltip:
+            entry_item.setToolTip(0, tooltip)
+        entry_item.setFlags(_ENTRY_ITEM_FLAGS)
+
+        entry_icon = self.resolve_icon(resolved_entry.get('icon'), QStyle.StandardPixmap.SP_FileIcon)
+        if not entry_icon.isNull():
+            entry_item.setIcon(0, entry_icon)
+        return entry_item
+
     def retranslate(self):
         """Reapply translations to all navigator items."""
         for top in range(self.widget.topLevelItemCount()):
@@ -728,18 +957,24 @@ class NavigatorManager(QObject):
                     child.setText(0, app_tr('NavigatorManager', raw_label))
 
     def resolve_icon(self, icon_name, fallback_standard_icon):
-        if icon_name:
-            icon_text = str(icon_name).strip()
-            if icon_text:
-                icon_path = Path(icon_text).expanduser()
-                if icon_path.exists() and icon_path.is_file():
-                    icon = QIcon(str(icon_path))
-                    if not icon.isNull():
-                        return icon
-
-                icon = QIcon.fromTheme(icon_text)
+        key = (str(icon_name or '').strip(), fallback_standard_icon)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._load_icon(key[0], fallback_standard_icon)
+            self._icon_cache[key] = icon
+        return icon
+
+    def _load_icon(self, icon_text, fallback_standard_icon):
+        if icon_text:
+            icon_path = Path(icon_text).expanduser()
+            if icon_path.exists() and icon_path.is_file():
+                icon = QIcon(str(icon_path))
                 if not icon.isNull():
                     return icon
+
+            icon = QIcon.fromTheme(icon_text)
+            if not icon.isNull():
+                return icon
         return QApplication.style().standardIcon(fallback_standard_icon)
 
     def serialize(self):
@@ -766,38 +1001,45 @@ class NavigatorManager(QObject):
                 group_data["icon"] = group_icon
 
             if not dynamic_mode:
+                # Each child.data() call crosses into C++; read every role at most once.
+                group_entries = group_data["entries"]
                 for child_index in range(group_item.childCount()):
                     child = group_item.child(child_index)
-                    entry_type = child.data(0, ROLE_ENTRY_TYPE) or 'entry'
-                    if entry_type == 'separator':
-                        entry_data = {
-                            "type": "separator",
-                            "label": child.text(0),
-                            "_entry_key": child.data(0, ROLE_ENTRY_KEY),
-                        }
-                    else:
-                        entry_data = {
-                            "label": child.text(0),
-                            "active": True,
-                            "_entry_key": child.data(0, ROLE_ENTRY_KEY),
-                        }
-                        entry_source = child.data(0, ROLE_ENTRY_SOURCE) or 'system'
-                        if entry_source == 'remote':
-                            continue
-                        if entry_source == 'custom':
-                            entry_data["source"] = "custom"
+                    if child.isHidden():
+                        # Deactivated in place; merge_group_entries re-adds it from loaded_data.
+                        continue
+                    if (child.data(0, ROLE_ENTRY_TYPE) or 'entry') == 'separator':
+                        group_entries.append(
+                            {
+                                "type": "separator",
+                                "label": child.text(0),
+                                "_entry_key": child.data(0, ROLE_ENTRY_KEY),
+                            }
+                        )
+                        continue
 
-                        entry_dynamic = child.data(0, ROLE_ENTRY_DYNAMIC)
-                        if entry_dynamic:
-                            entry_data["dynamic"] = entry_dynamic
-                        else:
-                            entry_data["path"] = child.data(0, ROLE_PATH) or ""
+                    entry_source = child.data(0, ROLE_ENTRY_SOURCE) or 'system'
+                    if entry_source == 'remote':
+                        continue
+                    entry_data = {
+                        "label": child.text(0),
+                        "active": True,
+                        "_entry_key": child.data(0, ROLE_ENTRY_KEY),
+                    }
+                    if entry_source == 'custom':
+                        entry_data["source"] = "custom"
+
+                    entry_dynamic = child.data(0, ROLE_ENTRY_DYNAMIC)
+                    if entry_dynamic:
+                        entry_data["dynamic"] = entry_dynamic
+                    else:
+                        entry_data["path"] = child.data(0, ROLE_PATH) or ""
 
-                        entry_icon = child.data(0, ROLE_ICON)
-                        if entry_icon:
-                            entry_data["icon"] = entry_icon
+                    entry_icon = child.data(0, ROLE_ICON)
+                    if entry_icon:
+                        entry_data["icon"] = entry_icon
 
-                    group_data["entries"].append(entry_data)
+                    group_entries.append(entry_data)
 
             visible_groups[self._normalize_group_name(group_name)] = group_data
 
@@ -811,14 +1053,28 @@ class NavigatorManager(QObject):
                     visible_group['entries'] = self.merge_group_entries(source_entries, visible_group['entries'])
                 groups.append(visible_group)
             else:
-                hidden_group = copy.deepcopy(source_group)
+                # Hidden groups are carried over untouched, so a shallow copy
+                # that only overrides 'active' is enough.
+                hidden_group = dict(source_group)
                 hidden_group['active'] = bool(source_group.get('active', False))
                 groups.append(hidden_group)
 
         return {"groups": groups}
 
     def save_current_state(self):
-        self.save_data(self.serialize())
+        # The serialized state is what gets written, so keep it as the
+        # in-memory copy instead of reading the file back.
+        self.loaded_data = self.serialize()
+        self._save_timer.start()
+
+    def flush_pending_save(self):
+        if not self._save_timer.isActive():
+            return
+        self._save_timer.stop()
+        self._write_pending_state()
+
+    def _write_pending_state(self):
+        self.save_data(self.loaded_data)
 
     def on_context_menu_requested(self, pos):
         item = self._context_menu_item_at(pos)
@@ -1032,7 +1288,6 @@ class NavigatorManager(QObject):
 
         parent.takeChild(index)
         self.save_current_state()
-        self.loaded_data = self.load_data()
         self.widget.clear()
         self.build_from_data(self.loaded_data)
 
@@ -1055,7 +1310,6 @@ class NavigatorManager(QObject):
 
         item.setText(0, new_name)
         self.save_current_state()
-        self.loaded_data = self.load_data()
 
     def set_system_entry_active(self, item, active):
         parent = item.parent()
@@ -1071,33 +1325,15 @@ class NavigatorManager(QObject):
 
     def set_system_entry_active_by_key(self, group_name, entry_key, active):
         group_name = self._normalize_group_name(group_name)
-        groups = self.loaded_data.get('groups', []) if isinstance(self.loaded_data, dict) else []
-        for group in groups:
-            if self._normalize_group_name(group.get('name', '')) != group_name:
-                continue
-
-            entries = group.get('entries', [])
-            if not isinstance(entries, list):
-                return
-
-            for idx, entry in enumerate(entries):
-                if not isinstance(entry, dict):
-                    continue
+        entry = self._entry_key_index.get((group_name, entry_key))
+        if entry is None:
+            return
 
-                source = str(entry.get('source', 'system')).strip()
-                if source != 'system':
-                    continue
-
-                key = self.build_entry_key(entry, idx)
-                if key != entry_key:
-                    continue
-
-                entry['active'] = bool(active)
-                self.save_data(self.loaded_data)
-                self.loaded_data = self.load_data()
-                self.widget.clear()
-                self.build_from_data(self.loaded_data)
-                return
+        entry['active'] = bool(active)
+        self._save_timer.start()
+        if not self._apply_system_entries_active(group_name, (entry_key,), bool(active)):
+            self.widget.clear()
+            self.build_from_data(self.loaded_data)
 
     def set_multiple_system_entries_active_by_keys(self, group_name, entry_keys, active):
         group_name = self._normalize_group_name(group_name)
@@ -1105,39 +1341,87 @@ class NavigatorManager(QObject):
         if not keys:
             return
 
-        groups = self.loaded_data.get('groups', []) if isinstance(self.loaded_data, dict) else []
-        changed = False
-        for group in groups:
-            if self._normalize_group_name(group.get('name', '')) != group_name:
+        changed_keys = []
+        for key in keys:
+            entry = self._entry_key_index.get((group_name, key))
+            if entry is None:
                 continue
+            entry['active'] = bool(active)
+            changed_keys.append(key)
 
-            entries = group.get('entries', [])
-            if not isinstance(entries, list):
-                break
-
-            for idx, entry in enumerate(entries):
-                if not isinstance(entry, dict):
-                    continue
+        if not changed_keys:
+            return
 
-                source = str(entry.get('source', 'system')).strip()
-                if source != 'system':
-                    continue
+        self._save_timer.start()
+        if not self._apply_system_entries_active(group_name, changed_keys, bool(active)):
+            self.widget.clear()
+            self.build_from_data(self.loaded_data)
 
-                key = self.build_entry_key(entry, idx)
-                if key not in keys:
-                    continue
+    def _visible_system_entry_count(self, group_item):
+        count = 0
+        for row in range(group_item.childCount()):
+            child = group_item.child(row)
+            if child.isHidden() or child.data(0, ROLE_KIND) != 'entry':
+                continue
+            if str(child.data(0, ROLE_ENTRY_SOURCE) or 'system').strip() == 'system':
+                count += 1
+        return count
+
+    def _apply_system_entries_active(self, group_name, entry_keys, active):
+        """Show or hide already built entry items instead of rebuilding the tree.
+
+        Returns False when the caller has to rebuild, which is only the case
+        when the Places separator between system and custom entries would
+        have to appear or disappear.
+        """
+        group_item = self._group_item_by_name(group_name)
+        if group_item is None or group_item.data(0, ROLE_DYNAMIC):
+            return True
 
-                entry['active'] = bool(active)
-                changed = True
-            break
+        if group_name == 'Places':
+            entries = self._group_entries_with_system_defaults(group_name)
+        else:
+            group = self._group_index.get(group_name)
+            entries = group.get('entries', []) if isinstance(group, dict) else []
+        ordered_keys = [
+            self.build_entry_key(entry, idx) if isinstance(entry, dict) else None
+            for idx, entry in enumerate(entries)
+        ]
+
+        visible_system_before = self._visible_system_entry_count(group_item)
+        for entry_key in entry_keys:
+            item = self._items_by_key.get((group_name, entry_key))
+            if item is not None:
+                item.setHidden(not active)
+                continue
+            if not active or entry_key not in ordered_keys:
+                continue
 
-        if not changed:
-            return
+            # Entry was inactive when the tree was built: create it now and
+            # place it right after the closest built entry preceding it.
+            position = ordered_keys.index(entry_key)
+            entry_item = self._create_entry_item(entries[position])
+            if entry_item is None:
+                continue
+            insert_row = 0
+            for previous_key in ordered_keys[:position]:
+                previous_item = self._items_by_key.get((group_name, previous_key))
+                if previous_item is not None:
+                    insert_row = max(insert_row, group_item.indexOfChild(previous_item) + 1)
+            group_item.insertChild(insert_row, entry_item)
+            self._items_by_key[(group_name, entry_key)] = entry_item
 
-        self.save_data(self.loaded_data)
-        self.loaded_data = self.load_data()
-        self.widget.clear()
-        self.build_from_data(self.loaded_data)
+        if group_name != 'Places':
+            return True
+        visible_system_after = self._visible_system_entry_count(group_item)
+        if (visible_system_before > 0) == (visible_system_after > 0):
+            return True
+        has_custom_entries = any(
+            group_item.child(row).data(0, ROLE_KIND) == 'entry'
+            and str(group_item.child(row).data(0, ROLE_ENTRY_SOURCE) or 'system').strip() == 'custom'
+            for row in range(group_item.childCount())
+        )
+        return not has_custom_entries
 
     def get_inactive_system_entries(self, group_name):
         result = []
@@ -1177,16 +1461,12 @@ class NavigatorManager(QObject):
     def _group_entries_with_system_defaults(self, group_name):
         group_name = self._normalize_group_name(group_name)
         default_groups = DEFAULT_NAVIGATOR_DATA.get('groups', []) if isinstance(DEFAULT_NAVIGATOR_DATA, dict) else []
-        loaded_groups = self.loaded_data.get('groups', []) if isinstance(self.loaded_data, dict) else []
 
         default_group = next(
             (group for group in default_groups if self._normalize_group_name(group.get('name', '')) == group_name),
             None,
         )
-        loaded_group = next(
-            (group for group in loaded_groups if self._normalize_group_name(group.get('name', '')) == group_name),
-            None,
-        )
+        loaded_group = self._group_index.get(group_name)
 
         default_entries = list(default_group.get('entries', [])) if isinstance(default_group, dict) else []
         loaded_entries = list(loaded_group.get('entries', [])) if isinstance(loaded_group, dict) else []
@@ -1200,7 +1480,7 @@ class NavigatorManager(QObject):
                 continue
             source = str(entry.get('source', 'system')).strip()
             if source == 'custom':
-                loaded_custom_entries.append(copy.deepcopy(entry))
+                loaded_custom_entries.append(_clone_entry(entry))
                 continue
             key = self.build_entry_key(entry, idx)
             loaded_system_by_key[key] = entry
@@ -1209,7 +1489,7 @@ class NavigatorManager(QObject):
         for idx, entry in enumerate(default_entries):
             if not isinstance(entry, dict):
                 continue
-            merged = copy.deepcopy(entry)
+            merged = _clone_entry(entry)
             key = self.build_entry_key(entry, idx)
             loaded_entry = loaded_system_by_key.get(key)
             if isinstance(loaded_entry, dict):
@@ -1246,6 +1526,11 @@ class NavigatorManager(QObject):
         )
 
     def refresh(self):
+        # A debounced save still pending would otherwise write the data
+        # reloaded below back over the user's last change.
+        self.flush_pending_save()
+        self._drive_entries_cache = None
+        self.clear_dynamic_cache()
         self.widget.clear()
         self.loaded_data = self.load_data()
         self.build_from_data(self.loaded_data)
@@ -1255,6 +1540,23 @@ class NavigatorManager(QObject):
             return
         if not bool(item.data(0, ROLE_COLLAPSIBLE)):
             item.setExpanded(True)
+            return
+        self._store_group_expanded(item, False)
+
+    def on_item_expanded(self, item: QTreeWidgetItem):
+        if item.data(0, ROLE_KIND) != 'group':
+            return
+        self._store_group_expanded(item, True)
+
+    def _store_group_expanded(self, group_item, expanded):
+        # Only the group's flag changes, so patch loaded_data directly and let
+        # the save timer write it instead of serializing the whole tree.
+        group_name = self._normalize_group_name(group_item.data(0, ROLE_GROUP_NAME) or group_item.text(0) or '')
+        group = self._group_index.get(group_name)
+        if not isinstance(group, dict) or group.get('expanded', True) == expanded:
+            return
+        group['expanded'] = expanded
+        self._save_timer.start()
 
     def resolve_entry_data(self, entry):
         if str(entry.get("source", "system")).strip() == "remote":
@@ -1272,38 +1574,26 @@ class NavigatorManager(QObject):
             }
 
         dynamic_token = entry.get('dynamic', '')
-        if not dynamic_token:
+        location = _DYNAMIC_ENTRY_LOCATIONS.get(dynamic_token) if dynamic_token else None
+        if location is None:
             return entry
 
-        dynamic_entry = {
-            'dynamic': dynamic_token,
-            'label': entry.get('label', ''),
-            'icon': entry.get('icon', ''),
-        }
-
-        if dynamic_token == 'home':
-            dynamic_entry['path'] = os.path.expanduser('~')
-            # keep raw label empty so build_from_data will use token for translation
-            dynamic_entry['icon'] = dynamic_entry['icon'] or 'user-home'
-        elif dynamic_token == 'trash':
-            dynamic_entry['path'] = os.path.expanduser('~/.local/share/Trash/files')
-            dynamic_entry['icon'] = dynamic_entry['icon'] or 'user-trash'
-        elif dynamic_token == 'desktop':
-            desktop_path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DesktopLocation)
-            dynamic_entry['path'] = desktop_path or os.path.expanduser('~/Desktop')
-            dynamic_entry['icon'] = dynamic_entry['icon'] or 'user-desktop'
-        elif dynamic_token == 'documents':
-            documents_path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DocumentsLocation)
-            dynamic_entry['path'] = documents_path or os.path.expanduser('~/Documents')
-            dynamic_entry['icon'] = dynamic_entry['icon'] or 'folder-documents'
-        elif dynamic_token == 'downloads':
-            downloads_path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DownloadLocation)
-            dynamic_entry['path'] = downloads_path or os.path.expanduser('~/Downloads')
-            dynamic_entry['icon'] = dynamic_entry['icon'] or 'folder-download'
-        else:
-            return entry
+        cache_key = (dynamic_token, entry.get('label', ''), entry.get('icon', ''))
+        resolved = self._dynamic_entry_cache.get(cache_key)
+        if resolved is None:
+            # keep raw label so build_from_data can fall back to the token for translation
+            resolved = {
+                'dynamic': dynamic_token,
+                'label': cache_key[1],
+                'icon': cache_key[2] or location[2],
+                'path': _dynamic_entry_path(dynamic_token),
+            }
+            self._dynamic_entry_cache[cache_key] = resolved
+        return resolved
 
-        return dynamic_entry
+    def clear_dynamic_cache(self):
+        self._dynamic_entry_cache.clear()
+        _dynamic_entry_path.cache_clear()
 
     def _remote_entries(self):
         if self.remote_mount_settings is None:
@@ -1316,9 +1606,10 @@ class NavigatorManager(QObject):
             return []
 
     def build_entry_key(self, entry, entry_index):
-        entry_type = entry.get('type', 'entry')
-        if entry_type == 'separator':
-            return entry.get('id', f'separator:{entry_index}')
+        if entry.get('type') == 'separator':
+            if 'id' in entry:
+                return entry['id']
+            return f'separator:{entry_index}'
 
         dynamic_token = entry.get('dynamic', '')
         if dynamic_token:
@@ -1329,22 +1620,19 @@ class NavigatorManager(QObject):
         return f'entry:{entry_index}:{label}:{path}'
 
     def merge_group_entries(self, source_entries, visible_entries):
+        # source_map is only read below, so it can hold the entries themselves.
         source_map = {}
-        for source_index, source_entry in enumerate(source_entries):
-            key = self.build_entry_key(source_entry, source_index)
-            source_map[key] = copy.deepcopy(source_entry)
-
         hidden_entries = []
         for source_index, source_entry in enumerate(source_entries):
-            key = self.build_entry_key(source_entry, source_index)
+            source_map[self.build_entry_key(source_entry, source_index)] = source_entry
             if source_entry.get('type') == 'separator':
                 continue
             if not source_entry.get('active', True):
-                hidden_entries.append(copy.deepcopy(source_entry))
+                hidden_entries.append(dict(source_entry))
 
         merged_entries = []
         for visible_entry in visible_entries:
-            normalized_visible = copy.deepcopy(visible_entry)
+            normalized_visible = dict(visible_entry)
             entry_key = normalized_visible.pop('_entry_key', None)
 
             if normalized_visible.get('type') == 'separator':
@@ -1363,68 +1651,59 @@ class NavigatorManager(QObject):
         return merged_entries
 
     def get_system_drive_entries(self):
+        signature = _drive_listing_signature()
+        if self._drive_entries_cache is None or signature != self._drive_entries_signature:
+            self._drive_entries_cache = self._scan_system_drive_entries()
+            self._drive_entries_signature = signature
+        return list(self._drive_entries_cache)
+
+    def _scan_system_drive_entries(self):
         drive_paths = []
         seen_paths = set()
 
-        def iter_subdirs(path_obj):
+        def iter_subdirs(path):
+            # DirEntry.is_dir() answers from the dirent type, without a stat per child.
             result = []
             try:
-                for child in path_obj.iterdir():
-                    try:
-                        if child.is_dir():
-                            result.append(child)
-                    except (OSError, PermissionError):
-                        continue
-            except (OSError, PermissionError):
+                with os.scandir(path) as children:
+                    for child in children:
+                        try:
+                            if child.is_dir():
+                                result.append(child.path)
+                        except OSError:
+                            continue
+            except OSError:
                 return []
             return result
 
-        def add_path(path):
-            expanded_path = os.path.expanduser(path)
-            try:
-                if not os.path.isdir(expanded_path):
-                    return
-            except (OSError, PermissionError):
+        def add_path_unchecked(path):
+            # Paths from iter_subdirs are already normalized directories.
+            if path in seen_paths:
                 return
-            normalized = os.path.normpath(expanded_path)
-            if normalized in seen_paths:
-                return
-            seen_paths.add(normalized)
-            drive_paths.append(normalized)
+            # Rescans yield the same mount paths; interning lets every
+            # cached entry and key built from them share one string.
+            path = sys.intern(path)
+            seen_paths.add(path)
+            drive_paths.append(path)
 
-        add_path('/')
+        if os.path.isdir('/'):
+            add_path_unchecked('/')
 
-        for base in ['/mnt', '/media']:
-            base_path = Path(base)
-            try:
-                if base_path.is_dir():
-                    for entry in sorted(iter_subdirs(base_path)):
-                        add_path(str(entry))
-            except (OSError, PermissionError):
-                continue
+        for base in _DRIVE_BASE_DIRS:
+            for mount_dir in sorted(iter_subdirs(base)):
+                add_path_unchecked(mount_dir)
 
-        run_media_base = Path('/run/media')
-        try:
-            if run_media_base.is_dir():
-                try:
-                    for user_dir in sorted(iter_subdirs(run_media_base)):
-                        try:
-                            for mount_dir in sorted(iter_subdirs(user_dir)):
-                                add_path(str(mount_dir))
-                        except (OSError, PermissionError):
-                            continue
-                except (OSError, PermissionError):
-                    pass
-        except (OSError, PermissionError):
-            pass
+        for user_dir in sorted(iter_subdirs(_RUN_MEDIA_DIR)):
+            for mount_dir in sorted(iter_subdirs(user_dir)):
+                add_path_unchecked(mount_dir)
 
         entries = []
         for path in drive_paths:
-            label = 'Root' if path == '/' else Path(path).name
+            label = _ROOT_LABEL if path == '/' else sys.intern(os.path.basename(path))
             entries.append({
                 'label': label,
                 'path': path,
-                'icon': 'drive-harddisk',
+                'icon': _DRIVE_ICON,
             })
 
         return entries
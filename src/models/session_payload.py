@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+def _dict_or_none(value) -> dict | None:
+    return value if isinstance(value, dict) else None
+
+
+@dataclass(slots=True)
+class SessionWindowGeometry:
+    x: int
+    y: int
+    width: int
+    height: int
+    maximized: bool
+
+    @classmethod
+    def from_dict(cls, raw) -> SessionWindowGeometry | None:
+        if not isinstance(raw, dict):
+            return None
+        try:
+            return cls(
+                x=int(raw.get("x", 100)),
+                y=int(raw.get("y", 100)),
+                width=int(raw.get("width", 1200)),
+                height=int(raw.get("height", 800)),
+                maximized=bool(raw.get("maximized", False)),
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass(slots=True)
+class SessionGroupState:
+    pane: dict | None
+    split_mode: str = "single"
+    secondary_pane: dict | None = None
+    tertiary_pane: dict | None = None
+    quaternary_pane: dict | None = None
+    title: str | None = None
+    icon: str = ""
+    first_tab_path: str = ""
+    raw: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> SessionGroupState:
+        pane = _dict_or_none(raw.get("pane"))
+        first_tab_path = ""
+        if pane is not None:
+            tabs = pane.get("tabs")
+            if isinstance(tabs, list) and tabs and isinstance(tabs[0], dict):
+                first_tab_path = str(tabs[0].get("path") or "")
+
+        return cls(
+            pane=pane,
+            split_mode=str(raw.get("split_mode") or "single"),
+            secondary_pane=_dict_or_none(raw.get("secondary_pane")),
+            tertiary_pane=_dict_or_none(raw.get("tertiary_pane")),
+            quaternary_pane=_dict_or_none(raw.get("quaternary_pane")),
+            title=str(raw.get("title") or "").strip() or None,
+            icon=str(raw.get("icon") or "").strip(),
+            first_tab_path=first_tab_path,
+            raw=raw,
+        )
+
+    @classmethod
+    def group_zero_from_dict(cls, raw) -> SessionGroupState | None:
+        if not isinstance(raw, dict):
+            return None
+        if isinstance(raw.get("tabs"), list):
+            # Legacy layout: group 0 stored its pane state at the top level.
+            return cls(pane=raw, raw=raw)
+        return cls.from_dict(raw)
+
+
+@dataclass(slots=True)
+class SessionPayload:
+    window: SessionWindowGeometry | None = None
+    splitter_sizes: list[int] = field(default_factory=list)
+    group_zero: SessionGroupState | None = None
+    groups: list[SessionGroupState] = field(default_factory=list)
+    active_group_index: int = 0
+
+    @classmethod
+    def from_dict(cls, raw) -> SessionPayload | None:
+        if not isinstance(raw, dict):
+            return None
+
+        splitter_sizes: list[int] = []
+        raw_splitter_sizes = raw.get("splitter_sizes")
+        if isinstance(raw_splitter_sizes, list):
+            try:
+                splitter_sizes = [int(size) for size in raw_splitter_sizes if int(size) > 0]
+            except (TypeError, ValueError):
+                splitter_sizes = []
+
+        groups: list[SessionGroupState] = []
+        raw_groups = raw.get("groups")
+        if isinstance(raw_groups, list):
+            groups = [SessionGroupState.from_dict(group_data) for group_data in raw_groups if isinstance(group_data, dict)]
+
+        try:
+            active_group_index = int(raw.get("active_group_index", 0))
+        except (TypeError, ValueError):
+            active_group_index = 0
+
+        return cls(
+            window=SessionWindowGeometry.from_dict(raw.get("window")),
+            splitter_sizes=splitter_sizes,
+            group_zero=SessionGroupState.group_zero_from_dict(raw.get("group0")),
+            groups=groups,
+            active_group_index=active_group_index,
+        )
@@ -2,7 +2,7 @@ from services.file_actions.ark_drop_service import ArkDropService
 from services.file_actions.archive_service import ArchiveService
 from services.file_actions.batch_rename_service import BatchRenameService
 from services.file_actions.creation_service import CreationService
-from services.file_actions.delete_service import DeleteExecutionResult, DeleteService
+from services.file_actions.delete_service import DeleteExecutionResult, DeleteService, DeleteWorker
 from services.file_actions.drop_service import DropContext, DropService
 from services.file_actions.drop_ui_service import DropUiService
 from services.file_actions.file_operation_service import FileOperationService, FileOperationSummary, FileOperationWorker
@@ -18,6 +18,7 @@ __all__ = [
     "CreationService",
     "DeleteExecutionResult",
     "DeleteService",
+    "DeleteWorker",
     "DuplicateExecutionResult",
     "DropContext",
     "DropService",
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from PySide6.QtCore import QDir
+from PySide6.QtCore import QDir, QObject, Signal
 
 from localization import app_tr
 
@@ -80,12 +80,35 @@ class DeleteService:
 
     def execute(self, paths: list[str], *, permanent: bool, file_operations) -> DeleteExecutionResult:
         result = DeleteExecutionResult()
-        for target in paths:
-            try:
-                file_operations.delete(target, permanent=permanent)
+        for target, error in file_operations.delete_many(paths, permanent=permanent):
+            if error is None:
                 result.deleted_paths.append(target)
-            except RuntimeError as error:
+            elif isinstance(error, RuntimeError):
                 result.errors.append(str(error))
-            except (FileNotFoundError, OSError, ValueError):
-                continue
         return result
+
+
+class DeleteWorker(QObject):
+    finished = Signal(object)
+
+    def __init__(self, delete_service: DeleteService, paths: list[str], permanent: bool, file_operations, parent=None):
+        super().__init__(parent)
+        self._delete_service = delete_service
+        self._paths = list(paths)
+        self._permanent = permanent
+        self._file_operations = file_operations
+
+    def run(self):
+        # finished must always fire: the owner only tears the thread down and
+        # accepts the next delete once it has seen a result.
+        result = DeleteExecutionResult()
+        try:
+            result = self._delete_service.execute(
+                self._paths,
+                permanent=self._permanent,
+                file_operations=self._file_operations,
+            )
+        except Exception as error:
+            result.errors.append(str(error) or error.__class__.__name__)
+        finally:
+            self.finished.emit(result)
@@ -31,20 +31,37 @@ class FileOperationWorker(QObject):
         completed = 0
         errors: list[str] = []
 
-        for index, task in enumerate(self._tasks, start=1):
-            label = self.progress_label(self._operation, task.name)
-            self.progressChanged.emit(index - 1, total, label)
+        if self._operation == "move":
+            for index, task in enumerate(self._tasks, start=1):
+                label = self.progress_label(self._operation, task.name)
+                self.progressChanged.emit(index - 1, total, label)
 
-            try:
-                if self._operation == "move":
+                try:
                     self._file_operations.move(task.source_path, task.target_path, overwrite=False)
+                    completed += 1
+                except (FileExistsError, FileNotFoundError, OSError, ValueError) as error:
+                    errors.append(str(error))
+
+                self.progressChanged.emit(index, total, label)
+        else:
+            # Copies go through copy_many() so the target directory is
+            # created and scanned once for the whole selection.
+            def report_progress(index: int) -> None:
+                label = self.progress_label(self._operation, self._tasks[index].name)
+                self.progressChanged.emit(index, total, label)
+
+            results = self._file_operations.copy_many(
+                [(task.source_path, task.target_path) for task in self._tasks],
+                overwrite=False,
+                progress=report_progress,
+            )
+            for _source, error in results:
+                if error is None:
+                    completed += 1
                 else:
-                    self._file_operations.copy(task.source_path, task.target_path, overwrite=False)
-                completed += 1
-            except (FileExistsError, FileNotFoundError, OSError, ValueError) as error:
-                errors.append(str(error))
-
-            self.progressChanged.emit(index, total, label)
+                    errors.append(str(error))
+            if self._tasks:
+                self.progressChanged.emit(total, total, self.progress_label(self._operation, self._tasks[-1].name))
 
         self.finished.emit(
             {
@@ -1,13 +1,39 @@
 import shiboken6
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QApplication, QGraphicsOpacityEffect, QSizePolicy, QSplitter, QVBoxLayout, QWidget
 
 from models.editor_settings import EditorSettings
 from controllers.pane_controller import PaneController
 
 
+_SPLIT_SLOTS = {
+    "single": (),
+    "2-split": ("secondary",),
+    "4-split": ("secondary", "tertiary", "quaternary"),
+}
+
+
+def _apply_opacity(widget, opacity):
+    """Dim *widget* to *opacity*, or undim it when *opacity* is None."""
+    if widget is None or not shiboken6.isValid(widget):
+        return
+    # The widget owns its effect, so graphicsEffect() doubles as the cache and
+    # the effect goes away with the widget. Effects are only toggled after
+    # creation; setGraphicsEffect(None) would destroy them.
+    effect = widget.graphicsEffect()
+    if opacity is None:
+        if effect is not None:
+            effect.setEnabled(False)
+        return
+    if not isinstance(effect, QGraphicsOpacityEffect):
+        effect = QGraphicsOpacityEffect(widget)
+        widget.setGraphicsEffect(effect)
+    effect.setOpacity(opacity)
+    effect.setEnabled(True)
+
+
 class GroupWorkspaceWidget(QWidget):
     currentPathChanged = Signal(str)
     navigationStateChanged = Signal(bool, bool)
@@ -32,6 +58,30 @@ class GroupWorkspaceWidget(QWidget):
         self._remote_drive_controller = remote_drive_controller
         self._local_office_web_session_store = local_office_web_session_store
         self._panes = {}
+        # Derived from _split_mode and _panes; reset whenever either changes.
+        self._pane_by_slot_cache = None
+        # Focus widget and pane mapping the active slot was last derived from.
+        self._focus_lookup_widget = None
+        self._focus_lookup_panes = None
+        # (split mode, panes) the current layout was built for.
+        self._rendered_topology = None
+        # Per shown pane: what its columns were last fitted to (see
+        # _column_signature). Entries are dropped when a pane's model reports
+        # changed data, since renames or size/date updates change text widths
+        # without touching the signature.
+        self._column_signatures = {}
+        self._column_watched_models = set()
+        # Split panes are only built once the workspace is shown; states
+        # restored before that wait here, keyed by slot.
+        self._pending_pane_states = {}
+        self._render_deferred = False
+        # Panes to reload after a sibling changed the filesystem; bursts of
+        # mutations collapse into one refresh per pane.
+        self._pending_refresh_panes = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(30)
+        self._refresh_timer.timeout.connect(self._flush_refreshes)
 
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -109,16 +159,23 @@ class GroupWorkspaceWidget(QWidget):
             return
 
         for pane in pane_by_slot.values():
-            if pane is source:
-                continue
-            if hasattr(pane, "refresh_current_directory"):
+            if pane is not source:
+                self._pending_refresh_panes.add(pane)
+        self._refresh_timer.start()
+
+    def _flush_refreshes(self):
+        pending = self._pending_refresh_panes
+        self._pending_refresh_panes = set()
+        for pane in self._pane_by_slot().values():
+            if pane in pending and hasattr(pane, "refresh_current_directory"):
                 pane.refresh_current_directory()
 
-    def _is_focus_in_pane(self, pane):
+    def _is_focus_in_pane(self, pane, focused_widget=None):
         pane_widget = getattr(pane, "widget", None)
         if pane_widget is None or not shiboken6.isValid(pane_widget):
             return False
-        focused_widget = QApplication.focusWidget()
+        if focused_widget is None:
+            focused_widget = QApplication.focusWidget()
         if focused_widget is None or not shiboken6.isValid(focused_widget):
             return False
         return pane_widget.isAncestorOf(focused_widget)
@@ -133,27 +190,29 @@ class GroupWorkspaceWidget(QWidget):
 
     def _update_active_slot_from_focus(self, pane_by_slot=None):
         pane_by_slot = pane_by_slot or self._pane_by_slot()
+        focused_widget = QApplication.focusWidget()
+        # Every path/navigation signal lands here, but focus rarely moves in
+        # between; only rescan the panes when focus or the pane set changed.
+        if focused_widget is self._focus_lookup_widget and pane_by_slot is self._focus_lookup_panes:
+            return
+        self._focus_lookup_widget = focused_widget
+        self._focus_lookup_panes = pane_by_slot
+
         for slot, pane in pane_by_slot.items():
-            if self._is_focus_in_pane(pane):
+            if self._is_focus_in_pane(pane, focused_widget):
                 self._active_slot = slot
                 return
         if self._active_slot not in pane_by_slot:
             self._active_slot = "primary"
 
     def _pane_by_slot(self):
-        panes = {"primary": self._panes.get("primary")}
-        if self._split_mode in {"2-split", "4-split"}:
-            secondary = self._panes.get("secondary")
-            if secondary:
-                panes["secondary"] = secondary
-        if self._split_mode == "4-split":
-            tertiary = self._panes.get("tertiary")
-            quaternary = self._panes.get("quaternary")
-            if tertiary:
-                panes["tertiary"] = tertiary
-            if quaternary:
-                panes["quaternary"] = quaternary
-        return {slot: pane for slot, pane in panes.items() if pane is not None}
+        if self._pane_by_slot_cache is None:
+            self._pane_by_slot_cache = self._build_pane_by_slot()
+        return self._pane_by_slot_cache
+
+    def _build_pane_by_slot(self):
+        slots = ("primary",) + _SPLIT_SLOTS[self._split_mode]
+        return {slot: pane for slot in slots if (pane := self._panes.get(slot)) is not None}
 
     def _set_pane_dimmed(self, pane, is_active):
         pane_widget = getattr(pane, "widget", None)
@@ -165,38 +224,28 @@ class GroupWorkspaceWidget(QWidget):
             tree_widget = pane_widget
         tree_viewport = tree_widget.viewport() if hasattr(tree_widget, "viewport") else None
 
-        if is_active:
-            pane_widget.setGraphicsEffect(None)
-            tree_widget.setGraphicsEffect(None)
-            if tree_viewport is not None and shiboken6.isValid(tree_viewport):
-                tree_viewport.setGraphicsEffect(None)
-            return
+        _apply_opacity(pane_widget, None if is_active else 0.9)
+        _apply_opacity(tree_widget, None if is_active else 0.8)
+        _apply_opacity(tree_viewport, None if is_active else 0.78)
 
-        pane_effect = pane_widget.graphicsEffect()
-        if not isinstance(pane_effect, QGraphicsOpacityEffect):
-            pane_effect = QGraphicsOpacityEffect(pane_widget)
-            pane_widget.setGraphicsEffect(pane_effect)
-        pane_effect.setOpacity(0.9)
-
-        tree_effect = tree_widget.graphicsEffect()
-        if not isinstance(tree_effect, QGraphicsOpacityEffect):
-            tree_effect = QGraphicsOpacityEffect(tree_widget)
-            tree_widget.setGraphicsEffect(tree_effect)
-        tree_effect.setOpacity(0.8)
-
-        if tree_viewport is not None and shiboken6.isValid(tree_viewport):
-            viewport_effect = tree_viewport.graphicsEffect()
-            if not isinstance(viewport_effect, QGraphicsOpacityEffect):
-                viewport_effect = QGraphicsOpacityEffect(tree_viewport)
-                tree_viewport.setGraphicsEffect(viewport_effect)
-            viewport_effect.setOpacity(0.78)
+    def _detach_panes_from_splitter(self, splitter, pane_widget_ids):
+        # Splitters only ever hold panes or nested splitters (4-split), so the
+        # direct children are enough; no need to probe every pane's ancestry.
+        for index in reversed(range(splitter.count())):
+            child = splitter.widget(index)
+            if child is None:
+                continue
+            if id(child) in pane_widget_ids:
+                child.setParent(None)
+            elif isinstance(child, QSplitter):
+                self._detach_panes_from_splitter(child, pane_widget_ids)
 
     def _clear_layout(self):
-        pane_widgets = []
+        pane_widget_ids = set()
         for pane in self._panes.values():
             pane_widget = getattr(pane, "widget", None)
             if pane_widget is not None and shiboken6.isValid(pane_widget):
-                pane_widgets.append(pane_widget)
+                pane_widget_ids.add(id(pane_widget))
 
         while self._layout.count() > 0:
             item = self._layout.takeAt(0)
@@ -205,13 +254,9 @@ class GroupWorkspaceWidget(QWidget):
                 continue
 
             if isinstance(widget, QSplitter):
-                for pane_widget in pane_widgets:
-                    if pane_widget == widget:
-                        continue
-                    if widget.isAncestorOf(pane_widget):
-                        pane_widget.setParent(None)
+                self._detach_panes_from_splitter(widget, pane_widget_ids)
 
-            if widget in pane_widgets:
+            if id(widget) in pane_widget_ids:
                 widget.setParent(None)
                 widget.setVisible(False)
             else:
@@ -219,13 +264,50 @@ class GroupWorkspaceWidget(QWidget):
                 shiboken6.delete(widget)
 
     def _render(self):
-        self._clear_layout()
-
+        # Reparenting and showing/hiding panes one by one would repaint the
+        # workspace after every step; paint once when the layout is complete.
+        # Reparenting also makes the panes report path/navigation changes that
+        # would re-enter the focus lookup; callers emit the final state once.
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        panes = [pane for pane in self._panes.values() if pane is not None]
+        signals_were_blocked = [pane.blockSignals(True) for pane in panes]
+        try:
+            self._render_layout()
+        finally:
+            for pane, was_blocked in zip(panes, signals_were_blocked):
+                pane.blockSignals(was_blocked)
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
+
+    def _render_layout(self):
         primary = self._panes.get("primary")
         if not primary:
+            self._clear_layout()
+            self._rendered_topology = None
             return
 
+        missing_slots = [slot for slot in _SPLIT_SLOTS[self._split_mode] if slot not in self._panes]
+        if missing_slots:
+            if not self.isVisible():
+                self._render_deferred = True
+                return
+            for slot in missing_slots:
+                self._ensure_split_pane(slot)
+        self._render_deferred = False
+
         pane_by_slot = self._pane_by_slot()
+        topology = (self._split_mode, tuple(pane_by_slot.items()))
+        if topology == self._rendered_topology:
+            self.refresh_active_highlight()
+            return
+        self._rendered_topology = topology
+
+        self._clear_layout()
+        shown_panes = set(pane_by_slot.values())
+        for pane in list(self._column_signatures):
+            if pane not in shown_panes:
+                del self._column_signatures[pane]
         for pane in pane_by_slot.values():
             pane.widget.setVisible(False)
 
@@ -241,8 +323,8 @@ class GroupWorkspaceWidget(QWidget):
             pane_by_slot["secondary"].widget.setVisible(True)
             split_host.setSizes([1, 1])
 
-            pane_by_slot["primary"].optimize_columns()
-            pane_by_slot["secondary"].optimize_columns()
+            self._optimize_pane_columns(pane_by_slot["primary"])
+            self._optimize_pane_columns(pane_by_slot["secondary"])
             self.refresh_active_highlight()
             return
 
@@ -268,30 +350,44 @@ class GroupWorkspaceWidget(QWidget):
             bottom_splitter.setSizes([1, 1])
 
             for pane in pane_by_slot.values():
-                pane.optimize_columns()
+                self._optimize_pane_columns(pane)
             self.refresh_active_highlight()
             return
 
         pane_by_slot["primary"].widget.setParent(self)
         self._layout.addWidget(pane_by_slot["primary"].widget, 1)
         pane_by_slot["primary"].widget.setVisible(True)
-        pane_by_slot["primary"].optimize_columns()
+        self._optimize_pane_columns(pane_by_slot["primary"])
         self.refresh_active_highlight()
 
     def _ensure_split_pane(self, slot):
         if slot in self._panes:
             return self._panes[slot]
-        pane = self._create_pane(clone_from_primary=True)
+        pending_state = self._pending_pane_states.pop(slot, None)
+        pane = self._create_pane(clone_from_primary=pending_state is None)
+        if pending_state is not None:
+            pane.import_state(pending_state)
         self._panes[slot] = pane
+        self._pane_by_slot_cache = None
         return pane
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._render_deferred:
+            self._render()
+            self._emit_active_state()
+
     def prepare_for_dispose(self):
         if self._dispose_prepared:
             return
         self._dispose_prepared = True
+        self._refresh_timer.stop()
+        self._pending_refresh_panes.clear()
+        self._column_signatures.clear()
 
         if self._split_mode != "single":
             self._split_mode = "single"
+            self._pane_by_slot_cache = None
             self._active_slot = "primary"
             self._render()
 
@@ -308,16 +404,15 @@ class GroupWorkspaceWidget(QWidget):
     def set_split_mode(self, mode):
         if mode not in {"single", "2-split", "4-split"}:
             return
+        if mode == self._split_mode:
+            return
 
-        if mode in {"2-split", "4-split"}:
-            self._ensure_split_pane("secondary")
-        if mode == "4-split":
-            self._ensure_split_pane("tertiary")
-            self._ensure_split_pane("quaternary")
-
+        # Missing split panes are created by _render once the workspace is visible.
         self._split_mode = mode
+        self._pane_by_slot_cache = None
         self._active_slot = "primary"
         self._render()
+        self._emit_active_state()
 
     def apply_close_icon_settings(self, show_file_tab_close_icons: bool):
         for pane in self._pane_by_slot().values():
@@ -332,13 +427,12 @@ class GroupWorkspaceWidget(QWidget):
 
     def export_split_state(self):
         payload = {"split_mode": self._split_mode}
-        if self._split_mode in {"2-split", "4-split"} and "secondary" in self._panes:
-            payload["secondary_pane"] = self._panes["secondary"].export_state()
-        if self._split_mode == "4-split":
-            if "tertiary" in self._panes:
-                payload["tertiary_pane"] = self._panes["tertiary"].export_state()
-            if "quaternary" in self._panes:
-                payload["quaternary_pane"] = self._panes["quaternary"].export_state()
+        for slot in _SPLIT_SLOTS[self._split_mode]:
+            pane = self._panes.get(slot)
+            if pane is not None:
+                payload[f"{slot}_pane"] = pane.export_state()
+            elif slot in self._pending_pane_states:
+                payload[f"{slot}_pane"] = self._pending_pane_states[slot]
         return payload
 
     def restore_split_state(self, split_mode, secondary_state=None, tertiary_state=None, quaternary_state=None):
@@ -348,19 +442,23 @@ class GroupWorkspaceWidget(QWidget):
         elif split_mode == "4-split":
             mode = "4-split"
 
-        if mode in {"2-split", "4-split"}:
-            secondary = self._ensure_split_pane("secondary")
-            if isinstance(secondary_state, dict):
-                secondary.import_state(secondary_state)
-        if mode == "4-split":
-            tertiary = self._ensure_split_pane("tertiary")
-            quaternary = self._ensure_split_pane("quaternary")
-            if isinstance(tertiary_state, dict):
-                tertiary.import_state(tertiary_state)
-            if isinstance(quaternary_state, dict):
-                quaternary.import_state(quaternary_state)
+        states = {
+            "secondary": secondary_state,
+            "tertiary": tertiary_state,
+            "quaternary": quaternary_state,
+        }
+        for slot in _SPLIT_SLOTS[mode]:
+            state = states[slot]
+            if not isinstance(state, dict):
+                continue
+            pane = self._panes.get(slot)
+            if pane is not None:
+                pane.import_state(state)
+            else:
+                self._pending_pane_states[slot] = state
 
         self._split_mode = mode
+        self._pane_by_slot_cache = None
         self._active_slot = "primary"
         self._render()
         self._emit_active_state()
@@ -392,7 +490,54 @@ class GroupWorkspaceWidget(QWidget):
 
     def optimize_columns(self):
         for pane in self._pane_by_slot().values():
-            pane.optimize_columns()
+            self._optimize_pane_columns(pane)
+
+    def _column_signature(self, pane):
+        tree_view = getattr(pane, "tree_view", None)
+        if tree_view is None or not shiboken6.isValid(tree_view):
+            return None
+        model = tree_view.model()
+        row_count = model.rowCount(tree_view.rootIndex()) if model is not None else 0
+        return (
+            pane.current_path(),
+            getattr(pane, "filetree_view_mode", None),
+            row_count,
+            tree_view.viewport().height(),
+        )
+
+    def _optimize_pane_columns(self, pane):
+        # Panes refit their own columns after every directory load; here we
+        # only need to refit when the listing or the visible height moved.
+        signature = self._column_signature(pane)
+        if signature is not None and self._column_signatures.get(pane) == signature:
+            return
+        self._column_signatures[pane] = signature
+        self._watch_column_model(pane)
+        pane.optimize_columns()
+
+    def _watch_column_model(self, pane):
+        tree_view = getattr(pane, "tree_view", None)
+        if tree_view is None or not shiboken6.isValid(tree_view):
+            return
+        model = tree_view.model()
+        # Panes share the local file model, so connect each model only once.
+        if model is None or model in self._column_watched_models:
+            return
+        # Remote models die with their pane; drop their stale wrappers here.
+        self._column_watched_models = {
+            watched for watched in self._column_watched_models if shiboken6.isValid(watched)
+        }
+        self._column_watched_models.add(model)
+        model.dataChanged.connect(self._on_column_model_changed)
+        model.layoutChanged.connect(self._on_column_model_changed)
+        model.modelReset.connect(self._on_column_model_changed)
+
+    def _on_column_model_changed(self, *_args):
+        model = self.sender()
+        for pane in list(self._column_signatures):
+            tree_view = getattr(pane, "tree_view", None)
+            if tree_view is None or not shiboken6.isValid(tree_view) or tree_view.model() is model:
+                del self._column_signatures[pane]
 
     def current_path(self):
         pane = self._active_pane()
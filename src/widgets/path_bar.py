@@ -1,8 +1,9 @@
 import os
 import posixpath
-from pathlib import Path
+import sys
+from functools import lru_cache
 
-from PySide6.QtCore import QEvent, Qt, Signal, QMimeData, QUrl, QPoint, QStringListModel
+from PySide6.QtCore import QEvent, Qt, Signal, QMimeData, QUrl, QPoint, QStringListModel, QTimer
 from PySide6.QtGui import QIcon, QDrag
 from PySide6.QtWidgets import (
     QApplication,
@@ -11,7 +12,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMenu,
     QSizePolicy,
-    QStackedLayout,
+    QStackedWidget,
     QStyle,
     QToolButton,
     QWidget,
@@ -21,10 +22,68 @@ from localization import app_tr
 from domain.filesystem import PaneLocation
 
 
+# Shared by every instance, so Qt's style sheet cache sees one identical string.
+_PATH_BAR_QSS = (
+    "QWidget#pathBarSurface {"
+    "  background-color: rgba(120, 120, 120, 0.16);"
+    "  border: 1px solid rgba(160, 160, 160, 0.40);"
+    "  border-radius: 6px;"
+    "}"
+    "QToolButton { border: none; background: transparent; padding: 2px 6px; border-radius: 4px; }"
+    "QToolButton:hover { background-color: rgba(110, 160, 255, 0.28); }"
+    "QLineEdit { padding-left: 6px; padding-right: 6px; }"
+)
+
+_PATH_MENU_QSS = (
+    "QMenu::item {"
+    " padding: 2px 14px;"
+    " min-height: 18px;"
+    "}"
+)
+
+
+# Breadcrumb paths recur constantly while navigating (up, back, siblings);
+# both helpers are pure in their input, so the results are memoized.
+@lru_cache(maxsize=512)
+def _normalize_local_path_cached(path):
+    # Interned, so equal paths coming back from here are also identical and
+    # the render-key and split-cache comparisons mostly hit the `is` check.
+    expanded = os.path.expanduser(path) if path.startswith("~") else path
+    return sys.intern(os.path.normpath(expanded))
+
+
+@lru_cache(maxsize=512)
+def _split_local_path_cached(normalized):
+    # Plain string splitting; the input is already normalized, so no
+    # PurePath objects are needed per segment.
+    drive, rest = os.path.splitdrive(normalized)
+    root = drive + os.path.sep
+    parts = [(root, root)]
+
+    current = root
+    for segment in rest.split(os.path.sep):
+        if not segment:
+            continue
+        current = current + segment if current.endswith(os.path.sep) else current + os.path.sep + segment
+        parts.append((segment, current))
+
+    return tuple(parts)
+
+
+@lru_cache(maxsize=64)
+def _local_drag_url(path):
+    # Percent-encoding is done once per crumb path, not on every drag.
+    url = QUrl.fromLocalFile(path)
+    encoded_uri = bytes(url.toEncoded()).decode("utf-8")
+    return url, (encoded_uri + "\n").encode("utf-8")
+
+
 class PathBar(QWidget):
     pathActivated = Signal(object)
     pathOpenInNewTab = Signal(object)
 
+    _FIXED_POLICY = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+
     def __init__(self, parent=None, bar_height=32, show_edit_button=True):
         super().__init__(parent)
         self._show_edit_button = show_edit_button
@@ -43,17 +102,31 @@ class PathBar(QWidget):
         self.setMinimumHeight(self._bar_height)
         self.setMaximumHeight(self._bar_height)
 
-        self._stack = QStackedLayout()
+        self._stack = QStackedWidget(self)
+        self._stack.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._stack.setMinimumWidth(0)
+        self._stack.setFixedHeight(self._bar_height)
         self._crumb_buttons = []
         self._crumb_arrow_buttons = []
         self._crumb_paths = {}
         self._crumb_arrow_paths = {}
         self._crumb_parts = []
+        # Crumb widgets dropped from the tail are kept here for reuse.
+        self._crumb_button_pool = []
+        self._crumb_arrow_pool = []
         self._overflow_button = None
         self._overflow_entries = []
         self._crumb_press_pos = QPoint()
         self._crumb_drag_button = None
+        self._start_drag_distance = QApplication.startDragDistance()
         self._outside_click_cancel_active = False
+        # Path changes arriving in a burst (key repeat, back/forward, model
+        # sync) are rendered once per frame; _current_path is always current.
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(16)
+        self._render_timer.timeout.connect(self._render_breadcrumbs)
+        self._breadcrumb_render_key = None
 
         self._crumbs_widget = QWidget(self)
         self._crumbs_widget.setObjectName("crumbsSurface")
@@ -77,13 +150,11 @@ class PathBar(QWidget):
         self._edit.textEdited.connect(self._on_edit_text_edited)
         self._edit.installEventFilter(self)
 
-        self._completion_model = QStringListModel(self)
-        self._completer = QCompleter(self._completion_model, self)
-        self._completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-        self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self._completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
-        self._completer.activated[str].connect(self._on_completion_activated)
-        self._edit.setCompleter(self._completer)
+        # Created on first edit; most path bars are never typed into.
+        self._completion_model = None
+        self._completer = None
+        # (base_dir, prefix) the completion model currently lists.
+        self._completion_listing_key = None
 
         self._stack.addWidget(self._crumbs_widget)
         self._stack.addWidget(self._edit)
@@ -124,14 +195,7 @@ class PathBar(QWidget):
         self._cancel_button.clicked.connect(self._cancel_edit_mode)
         self._cancel_button.hide()
 
-        stack_host = QWidget(self)
-        stack_host.setLayout(self._stack)
-        stack_host.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        stack_host.setMinimumWidth(0)
-        stack_host.setMinimumHeight(self._bar_height)
-        stack_host.setMaximumHeight(self._bar_height)
-
-        self._surface_layout.addWidget(stack_host)
+        self._surface_layout.addWidget(self._stack)
         self._surface_layout.addWidget(self._edit_button)
         self._surface_layout.addWidget(self._accept_button)
         self._surface_layout.addWidget(self._cancel_button)
@@ -140,18 +204,11 @@ class PathBar(QWidget):
         if not show_edit_button:
             self._edit_button.hide()
 
-        self.setStyleSheet(
-            "QWidget#pathBarSurface {"
-            "  background-color: rgba(120, 120, 120, 0.16);"
-            "  border: 1px solid rgba(160, 160, 160, 0.40);"
-            "  border-radius: 6px;"
-            "}"
-            "QToolButton { border: none; background: transparent; padding: 2px 6px; border-radius: 4px; }"
-            "QToolButton:hover { background-color: rgba(110, 160, 255, 0.28); }"
-            "QLineEdit { padding-left: 6px; padding-right: 6px; }"
-        )
+        self.setStyleSheet(_PATH_BAR_QSS)
 
         self.set_path(self._current_path)
+        self._render_timer.stop()
+        self._render_breadcrumbs()
         self._set_mode("breadcrumbs")
 
     def retranslate_ui_texts(self):
@@ -180,8 +237,19 @@ class PathBar(QWidget):
     def set_path(self, path):
         normalized_path = self._normalize_remote_path(path) if self._current_location.is_remote else self._normalize_local_path(path)
         self._current_path = normalized_path
-        self._edit.setText(normalized_path)
-        self._render_breadcrumbs()
+        if self._edit.text() != normalized_path:
+            self._edit.setText(normalized_path)
+        # Panes re-sync the bar with the path it already shows all the time;
+        # only schedule a render when something the crumbs depend on changed.
+        render_key = (
+            self._current_location.kind,
+            self._current_location.remote_id,
+            self._remote_root_label,
+            normalized_path,
+        )
+        if render_key != self._breadcrumb_render_key:
+            self._breadcrumb_render_key = render_key
+            self._render_timer.start()
         self._update_edit_availability()
 
     def _update_edit_availability(self):
@@ -194,11 +262,24 @@ class PathBar(QWidget):
         if self._current_location.is_remote:
             return
         self._edit.setText(self._current_path)
+        self._completion_listing_key = None
         self._set_mode("edit")
         self._edit.setFocus()
         self._edit.selectAll()
         self._update_completions(self._edit.text(), force_popup=False)
 
+    def _ensure_completer(self):
+        if self._completer is not None:
+            return
+        self._completion_model = QStringListModel(self)
+        self._completer = QCompleter(self._completion_model, self)
+        self._completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        self._completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
+        self._completer.activated[str].connect(self._on_completion_activated)
+        self._edit.setCompleter(self._completer)
+
     def _exit_edit_mode(self):
         self._set_mode("breadcrumbs")
 
@@ -268,7 +349,7 @@ class PathBar(QWidget):
     def _expanded_path(self, value):
         if not value:
             return ""
-        return os.path.expanduser(value)
+        return os.path.expanduser(value) if value.startswith("~") else value
 
     def _completion_context(self, text):
         raw_text = text or ""
@@ -314,8 +395,8 @@ class PathBar(QWidget):
         return candidates
 
     def _update_completions(self, text, force_popup):
+        self._ensure_completer()
         base_dir, fragment = self._completion_context(text)
-        names = self._list_directory_candidates(base_dir, fragment)
 
         expanded_text = self._expanded_path(text)
         if expanded_text.endswith(os.path.sep):
@@ -323,11 +404,16 @@ class PathBar(QWidget):
         else:
             prefix = (base_dir + os.path.sep) if base_dir else ""
 
-        values = [prefix + name for name in names]
-        self._completion_model.setStringList(values)
+        # The directory is listed once per base; typing further only moves the
+        # completion prefix, which the completer locates in the sorted model.
+        listing_key = (base_dir, prefix)
+        if listing_key != self._completion_listing_key:
+            names = self._list_directory_candidates(base_dir, "")
+            self._completion_model.setStringList([prefix + name for name in names])
+            self._completion_listing_key = listing_key
         self._completer.setCompletionPrefix(prefix + fragment)
 
-        if force_popup and values:
+        if force_popup and self._completer.completionCount():
             self._completer.complete()
 
     def _on_completion_activated(self, value):
@@ -341,12 +427,10 @@ class PathBar(QWidget):
         self._update_completions(selected, force_popup=True)
 
     def eventFilter(self, watched, event):
-        app = QApplication.instance()
-        if (
-            self._outside_click_cancel_active
-            and app is not None
-            and event.type() == QEvent.Type.MouseButtonPress
-        ):
+        # While editing, this filter sits on the whole application; read the
+        # event type once and leave as soon as the watched object is known.
+        event_type = event.type()
+        if self._outside_click_cancel_active and event_type == QEvent.Type.MouseButtonPress:
             global_pos = self._event_global_pos(event)
             if global_pos is None:
                 return False
@@ -360,123 +444,182 @@ class PathBar(QWidget):
             self._cancel_edit_mode()
             return False
 
-        if watched in self._crumb_buttons:
-            if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
-                self._crumb_press_pos = event.position().toPoint()
-                self._crumb_drag_button = watched
-
-            if event.type() == QEvent.Type.MouseMove and self._crumb_drag_button is watched:
-                if not (event.buttons() & Qt.MouseButton.LeftButton):
-                    return False
-
-                distance = (event.position().toPoint() - self._crumb_press_pos).manhattanLength()
-                if distance >= QApplication.startDragDistance():
-                    target_path = self._crumb_paths.get(watched)
-                    if isinstance(target_path, str) and target_path and os.path.isdir(target_path):
-                        self._start_path_drag(watched, target_path)
-                        self._crumb_drag_button = None
-                        return True
-
-            if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
-                self._crumb_drag_button = None
+        # The path dicts hold exactly the rendered crumbs and arrows, so they
+        # double as O(1) membership tests; the lists only keep the order.
+        if watched in self._crumb_paths:
+            return self._filter_crumb_button_event(watched, event, event_type)
 
-            if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.MiddleButton:
-                target_path = self._crumb_paths.get(watched)
-                if target_path:
-                    self.pathOpenInNewTab.emit(target_path)
-                    return True
-
-        if watched in self._crumb_arrow_buttons:
-            if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+        if watched in self._crumb_arrow_paths:
+            if event_type == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
                 self._show_subdirectory_menu(watched)
                 return True
-            if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.MiddleButton:
+            if event_type == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.MiddleButton:
                 target_path = self._crumb_arrow_paths.get(watched)
                 if target_path:
                     self.pathOpenInNewTab.emit(target_path)
                     return True
+            return False
 
         if watched is self._overflow_button:
-            if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            if event_type == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
                 self._show_overflow_menu()
                 return True
+            return False
 
-        if watched == self._crumbs_widget and event.type() == QEvent.Type.MouseButtonPress:
-            clicked_widget = self._crumbs_widget.childAt(event.position().toPoint())
-            if (
-                self._current_location.is_local
-                and clicked_widget not in self._crumb_buttons
-                and clicked_widget not in self._crumb_arrow_buttons
-                and clicked_widget is not self._overflow_button
-            ):
+        if watched is self._crumbs_widget:
+            if event_type == QEvent.Type.MouseButtonPress and self._current_location.is_local:
+                # Buttons accept their own left presses, so a left press that
+                # reaches the surface landed on empty space. Other buttons are
+                # ignored by QToolButton and propagate, so those still need a
+                # hit test.
+                if event.button() != Qt.MouseButton.LeftButton:
+                    clicked_widget = self._crumbs_widget.childAt(event.position().toPoint())
+                    if (
+                        clicked_widget in self._crumb_paths
+                        or clicked_widget in self._crumb_arrow_paths
+                        or clicked_widget is self._overflow_button
+                    ):
+                        return False
                 self.start_edit_mode()
                 return True
+            return False
 
-        if watched == self._edit and event.type() == QEvent.Type.KeyPress:
-            if event.key() == Qt.Key.Key_Escape:
+        if watched is self._edit:
+            if event_type == QEvent.Type.KeyPress and event.key() == Qt.Key.Key_Escape:
                 self._cancel_edit_mode()
                 return True
+            return False
 
         return super().eventFilter(watched, event)
 
+    def _filter_crumb_button_event(self, watched, event, event_type):
+        if event_type == QEvent.Type.MouseMove:
+            if self._crumb_drag_button is not watched or not (event.buttons() & Qt.MouseButton.LeftButton):
+                return False
+
+            distance = (event.position().toPoint() - self._crumb_press_pos).manhattanLength()
+            if distance >= self._start_drag_distance:
+                # Local crumbs are the ancestors of the current directory,
+                # so no stat is needed here; remote crumbs are PaneLocations.
+                target_path = self._crumb_paths.get(watched)
+                if isinstance(target_path, str) and target_path:
+                    self._start_path_drag(watched, target_path)
+                    self._crumb_drag_button = None
+                    return True
+            return False
+
+        if event_type == QEvent.Type.MouseButtonPress:
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._crumb_press_pos = event.position().toPoint()
+                self._crumb_drag_button = watched
+            return False
+
+        if event_type == QEvent.Type.MouseButtonRelease:
+            button = event.button()
+            if button == Qt.MouseButton.LeftButton:
+                self._crumb_drag_button = None
+            elif button == Qt.MouseButton.MiddleButton:
+                target_path = self._crumb_paths.get(watched)
+                if target_path:
+                    self.pathOpenInNewTab.emit(target_path)
+                    return True
+        return False
+
+    def _create_crumb_button(self, text):
+        button = QToolButton(self._crumbs_widget)
+        button.setText(text)
+        button.setAutoRaise(True)
+        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+        button.setSizePolicy(self._FIXED_POLICY)
+        button.setFixedHeight(self._bar_height)
+        button.installEventFilter(self)
+        return button
+
+    def _acquire_crumb_button(self):
+        if self._crumb_button_pool:
+            return self._crumb_button_pool.pop()
+        button = self._create_crumb_button("")
+        button.clicked.connect(self._on_crumb_clicked)
+        return button
+
+    def _on_crumb_clicked(self):
+        target_path = self._crumb_paths.get(self.sender())
+        if target_path:
+            self.pathActivated.emit(target_path)
+
+    def _acquire_crumb_arrow_button(self):
+        if self._crumb_arrow_pool:
+            return self._crumb_arrow_pool.pop()
+        return self._create_crumb_button("›")
+
     def _render_breadcrumbs(self):
-        self._crumb_buttons.clear()
-        self._crumb_arrow_buttons.clear()
-        self._crumb_paths.clear()
-        self._crumb_arrow_paths.clear()
-        self._crumb_parts.clear()
-        self._overflow_entries = []
-        while self._crumbs_layout.count():
-            item = self._crumbs_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-        self._overflow_button = None
+        # Every add/remove invalidates the crumb layout; repaint once at the end.
+        updates_were_enabled = self._crumbs_widget.updatesEnabled()
+        self._crumbs_widget.setUpdatesEnabled(False)
+        try:
+            self._render_breadcrumb_widgets()
+        finally:
+            if updates_were_enabled:
+                self._crumbs_widget.setUpdatesEnabled(True)
 
+    def _render_breadcrumb_widgets(self):
         parts = self._split_location()
+
+        # Navigation mostly stays within one branch (into a subfolder, up,
+        # back); crumbs for the shared leading segments are kept as they are
+        # and only the tail is rebuilt, from pooled widgets where possible.
+        common = 0
+        for old_part, new_part in zip(self._crumb_parts, parts):
+            if old_part != new_part:
+                break
+            common += 1
+
+        while self._crumbs_layout.count():
+            self._crumbs_layout.takeAt(0)
+
+        for button in self._crumb_buttons[common:]:
+            self._crumb_paths.pop(button, None)
+            button.setToolTip("")
+            button.hide()
+            self._crumb_button_pool.append(button)
+        del self._crumb_buttons[common:]
+
+        kept_arrows = min(common, len(parts) - 1)
+        for arrow_button in self._crumb_arrow_buttons[kept_arrows:]:
+            self._crumb_arrow_paths.pop(arrow_button, None)
+            arrow_button.hide()
+            self._crumb_arrow_pool.append(arrow_button)
+        del self._crumb_arrow_buttons[kept_arrows:]
+
         self._crumb_parts = list(parts)
-        for index, (label, target_path) in enumerate(parts):
-            button = QToolButton(self._crumbs_widget)
+        self._overflow_entries = []
+        self._crumb_drag_button = None
+
+        for label, target_path in parts[len(self._crumb_buttons):]:
+            button = self._acquire_crumb_button()
             button.setText(label)
-            button.setAutoRaise(True)
-            button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-            button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-            button.setMinimumHeight(self._bar_height)
-            button.setMaximumHeight(self._bar_height)
-            button.clicked.connect(lambda _, target=target_path: self.pathActivated.emit(target))
-            button.installEventFilter(self)
-            if self._current_location.is_remote and index == 0 and self._remote_root_label:
-                button.setToolTip(self._remote_root_label)
-            self._crumbs_layout.addWidget(button)
             self._crumb_buttons.append(button)
             self._crumb_paths[button] = target_path
 
-            if index < len(parts) - 1:
-                arrow_button = QToolButton(self._crumbs_widget)
-                arrow_button.setText("›")
-                arrow_button.setAutoRaise(True)
-                arrow_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-                arrow_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-                arrow_button.setMinimumHeight(self._bar_height)
-                arrow_button.setMaximumHeight(self._bar_height)
-                arrow_button.installEventFilter(self)
-                self._crumbs_layout.addWidget(arrow_button)
-                self._crumb_arrow_buttons.append(arrow_button)
-                self._crumb_arrow_paths[arrow_button] = target_path
-
-        self._overflow_button = QToolButton(self._crumbs_widget)
-        self._overflow_button.setText("…")
-        self._overflow_button.setAutoRaise(True)
-        self._overflow_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-        self._overflow_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self._overflow_button.setMinimumHeight(self._bar_height)
-        self._overflow_button.setMaximumHeight(self._bar_height)
-        self._overflow_button.installEventFilter(self)
+        for _label, target_path in parts[len(self._crumb_arrow_buttons) : len(parts) - 1]:
+            arrow_button = self._acquire_crumb_arrow_button()
+            self._crumb_arrow_buttons.append(arrow_button)
+            self._crumb_arrow_paths[arrow_button] = target_path
+
+        if self._crumb_buttons:
+            root_tooltip = self._remote_root_label if self._current_location.is_remote else ""
+            self._crumb_buttons[0].setToolTip(root_tooltip)
+
+        if self._overflow_button is None:
+            self._overflow_button = self._create_crumb_button("…")
         self._overflow_button.hide()
+
         if self._crumb_buttons:
-            self._crumbs_layout.insertWidget(1, self._overflow_button)
-        else:
-            self._crumbs_layout.addWidget(self._overflow_button)
+            self._crumbs_layout.addWidget(self._crumb_buttons[0])
+        self._crumbs_layout.addWidget(self._overflow_button)
+        for arrow_button, button in zip(self._crumb_arrow_buttons, self._crumb_buttons[1:]):
+            self._crumbs_layout.addWidget(arrow_button)
+            self._crumbs_layout.addWidget(button)
         self._crumbs_layout.addStretch(1)
         self._update_breadcrumb_overflow()
 
@@ -554,12 +697,7 @@ class PathBar(QWidget):
         if self._overflow_button is None or not self._overflow_entries:
             return
         menu = QMenu(self)
-        menu.setStyleSheet(
-            "QMenu::item {"
-            " padding: 2px 14px;"
-            " min-height: 18px;"
-            "}"
-        )
+        menu.setStyleSheet(_PATH_MENU_QSS)
         for label, target in self._overflow_entries:
             action = menu.addAction(label)
             action.triggered.connect(lambda checked=False, target_path=target: self.pathActivated.emit(target_path))
@@ -592,12 +730,7 @@ class PathBar(QWidget):
             return
 
         menu = QMenu(self)
-        menu.setStyleSheet(
-            "QMenu::item {"
-            " padding: 2px 14px;"
-            " min-height: 18px;"
-            "}"
-        )
+        menu.setStyleSheet(_PATH_MENU_QSS)
         if self._current_location.is_remote:
             subdirectories = self._list_remote_subdirectories(base_path)
         else:
@@ -614,12 +747,7 @@ class PathBar(QWidget):
             remaining = subdirectories[self._max_primary_subdir_items :]
             if remaining:
                 more_menu = menu.addMenu(app_tr("PathBar", "Weitere…"))
-                more_menu.setStyleSheet(
-                    "QMenu::item {"
-                    " padding: 2px 14px;"
-                    " min-height: 18px;"
-                    "}"
-                )
+                more_menu.setStyleSheet(_PATH_MENU_QSS)
                 for name, target_path in remaining:
                     action = more_menu.addAction(name)
                     action.triggered.connect(lambda checked=False, target=target_path: self.pathActivated.emit(target))
@@ -652,18 +780,7 @@ class PathBar(QWidget):
         return self._split_local_path(self._current_path)
 
     def _split_local_path(self, path):
-        normalized = self._normalize_local_path(path)
-        root = Path(normalized).anchor or os.path.sep
-        parts = [(root, root)]
-
-        current = Path(root)
-        for segment in Path(normalized).parts:
-            if segment in (root, os.path.sep):
-                continue
-            current = current / segment
-            parts.append((segment, str(current)))
-
-        return parts
+        return list(_split_local_path_cached(self._normalize_local_path(path)))
 
     def _split_remote_location(self):
         normalized = self._normalize_remote_path(self._current_location.path)
@@ -685,8 +802,7 @@ class PathBar(QWidget):
     def _normalize_local_path(self, path):
         if not path:
             return self._current_path
-        expanded = os.path.expanduser(path)
-        return os.path.normpath(expanded)
+        return _normalize_local_path_cached(path)
 
     def _normalize_remote_path(self, path):
         raw = str(path or "").strip()
@@ -699,10 +815,9 @@ class PathBar(QWidget):
 
     def _start_path_drag(self, source_widget, path):
         mime_data = QMimeData()
-        url = QUrl.fromLocalFile(path)
-        encoded_uri = bytes(url.toEncoded()).decode("utf-8")
+        url, uri_list = _local_drag_url(path)
         mime_data.setUrls([url])
-        mime_data.setData("text/uri-list", (encoded_uri + "\n").encode("utf-8"))
+        mime_data.setData("text/uri-list", uri_list)
 
         drag = QDrag(source_widget)
         drag.setMimeData(mime_data)
@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from models.file_operations import FileOperations
+from services.file_actions import FileOperationWorker, FileTransferTask
+
+
+class _RecordingFileOperations(FileOperations):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def copy(self, *args, **kwargs):
+        raise AssertionError("copies must go through copy_many()")
+
+    def copy_many(self, pairs, overwrite=False, progress=None):
+        self.batches.append(list(pairs))
+        return super().copy_many(pairs, overwrite=overwrite, progress=progress)
+
+
+def test_worker_copies_selection_in_one_batch(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "b.txt").write_text("old")
+    tasks = [
+        FileTransferTask(str(tmp_path / name), str(target / name), name)
+        for name in ("a.txt", "b.txt")
+    ]
+    file_operations = _RecordingFileOperations()
+    worker = FileOperationWorker(file_operations, "copy", tasks)
+    progress = []
+    summaries = []
+    worker.progressChanged.connect(lambda value, total, _label: progress.append((value, total)))
+    worker.finished.connect(summaries.append)
+
+    worker.run()
+
+    assert len(file_operations.batches) == 1
+    assert progress == [(0, 2), (1, 2), (2, 2)]
+    assert summaries[0]["completed_count"] == 1
+    assert summaries[0]["error_count"] == 1
+    assert (target / "a.txt").read_text() == "a"
+    assert (target / "b.txt").read_text() == "old"
@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from models.file_operations import FileOperations
+
+
+def _make_tree(root):
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "sub" / "b.txt").write_text("b")
+
+
+def test_copy_folder_into_own_subfolder(tmp_path):
+    source = tmp_path / "folder"
+    _make_tree(source)
+
+    target = FileOperations().copy(source, source / "sub")
+
+    assert target == source / "sub" / "folder"
+    assert (target / "a.txt").read_text() == "a"
+    assert (target / "sub" / "b.txt").read_text() == "b"
+    assert not (target / "sub" / "folder").exists()
+
+
+def test_failed_tree_copy_removes_partial_target(tmp_path, monkeypatch):
+    source = tmp_path / "folder"
+    _make_tree(source)
+    operations = FileOperations()
+
+    def failing_copy(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(operations, "_copy_file_fast", failing_copy)
+    with pytest.raises(OSError):
+        operations.copy(source, tmp_path / "copy")
+
+    assert not (tmp_path / "copy").exists()
+
+
+def test_copy_many_reports_each_pair(tmp_path):
+    source = tmp_path / "folder"
+    _make_tree(source)
+    destination = tmp_path / "out"
+    destination.mkdir()
+    (destination / "a.txt").write_text("old")
+    pairs = [
+        (source / "a.txt", destination / "a.txt"),
+        (source / "sub", destination / "sub"),
+        (source / "a.txt", destination / "b.txt"),
+        (source / "a.txt", destination / "b.txt"),
+        (source / "missing", destination / "missing"),
+    ]
+    started = []
+
+    results = FileOperations().copy_many(pairs, progress=started.append)
+
+    errors = [type(error) if error is not None else None for _source, error in results]
+    assert errors == [FileExistsError, None, None, FileExistsError, FileNotFoundError]
+    assert started == [0, 1, 2, 3, 4]
+    assert (destination / "a.txt").read_text() == "old"
+    assert (destination / "b.txt").read_text() == "a"
+    assert (destination / "sub" / "b.txt").read_text() == "b"